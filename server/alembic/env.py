@@ -25,16 +25,10 @@ else:
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import your models and database configuration
-from app.core.database import Base
 from app.core.config import settings
 
-# Import all models to ensure they're registered with Base.metadata
-from app.models import (
-    User, APIKey, Watchlist,
-    Stock, HistoricalData, EMACache,
-    TodaysMover, MainList,
-    CreditSpread
-)
+# Importing the models package registers every model on the shared metadata
+from app.models import metadata
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -47,7 +41,7 @@ if config.config_file_name is not None:
 
 # add your model's MetaData object here
 # for 'autogenerate' support
-target_metadata = Base.metadata
+target_metadata = metadata
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
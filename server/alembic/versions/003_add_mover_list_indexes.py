@@ -0,0 +1,34 @@
+"""Add composite and partial indexes for movers and main lists
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-01-03 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Movers filtered by type and ordered by calculation time
+    op.create_index('idx_todays_movers_type_calc', 'todays_movers', ['mover_type', 'calculated_at'], unique=False)
+    
+    # Only active list entries are queried by list type
+    op.create_index(
+        'idx_main_lists_active_type',
+        'main_lists',
+        ['list_type'],
+        unique=False,
+        postgresql_where=sa.text('is_active = true')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_main_lists_active_type', table_name='main_lists')
+    op.drop_index('idx_todays_movers_type_calc', table_name='todays_movers')
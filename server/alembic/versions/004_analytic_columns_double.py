@@ -0,0 +1,66 @@
+"""Store analytic indicator columns as double precision
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-01-04 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+# Indicator columns per table with their previous NUMERIC(precision, scale)
+ANALYTIC_COLUMNS = {
+    'stocks': {
+        'variability_52w': (10, 2),
+        'variability_monthly': (10, 2),
+        'variability_3day': (10, 2),
+    },
+    'ema_cache': {
+        'ema22': (12, 4),
+        'ema53': (12, 4),
+        'ema208': (12, 4),
+    },
+    'main_lists': {
+        'variability_52w': (10, 2),
+        'variability_monthly': (10, 2),
+        'variability_3day': (10, 2),
+    },
+    'todays_movers': {
+        'volume_ratio': (10, 2),
+        'ema22': (12, 4),
+        'ema53': (12, 4),
+        'ema208': (12, 4),
+        'ema_strength': (10, 2),
+        'trend_score': (10, 2),
+    },
+}
+
+
+def upgrade() -> None:
+    for table, columns in ANALYTIC_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, (precision, scale) in columns.items():
+                batch_op.alter_column(
+                    column,
+                    type_=sa.Double(),
+                    existing_type=sa.Numeric(precision=precision, scale=scale),
+                    existing_nullable=True
+                )
+
+
+def downgrade() -> None:
+    for table, columns in ANALYTIC_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, (precision, scale) in columns.items():
+                batch_op.alter_column(
+                    column,
+                    type_=sa.Numeric(precision=precision, scale=scale),
+                    existing_type=sa.Double(),
+                    existing_nullable=True
+                )
@@ -0,0 +1,61 @@
+"""Drop duplicate primary key indexes and use identity keys for ingest tables
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-01-05 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+# Secondary indexes duplicating the primary key index
+PRIMARY_KEY_INDEXES = {
+    'users': 'ix_users_id',
+    'api_keys': 'ix_api_keys_id',
+    'watchlists': 'ix_watchlists_id',
+    'credit_spreads': 'ix_credit_spreads_id',
+    'stocks': 'ix_stocks_id',
+    'historical_data': 'ix_historical_data_id',
+    'ema_cache': 'ix_ema_cache_id',
+    'main_lists': 'ix_main_lists_id',
+    'todays_movers': 'ix_todays_movers_id',
+    'claims': 'ix_claims_id',
+}
+
+# Append-heavy tables switched from SERIAL to BIGINT identity keys
+IDENTITY_TABLES = ('todays_movers', 'historical_data', 'ema_cache')
+
+
+def upgrade() -> None:
+    for index_name in PRIMARY_KEY_INDEXES.values():
+        op.execute(f'DROP INDEX IF EXISTS {index_name}')
+    
+    for table in IDENTITY_TABLES:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT')
+        op.execute(f'DROP SEQUENCE IF EXISTS {table}_id_seq')
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN id TYPE BIGINT')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN id '
+            f'ADD GENERATED BY DEFAULT AS IDENTITY (START WITH 1 CACHE 1000)'
+        )
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(IDENTITY_TABLES):
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY')
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN id TYPE INTEGER')
+        op.execute(f'CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id')
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')")
+        op.execute(f"SELECT setval('{table}_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM {table}")
+    
+    for table in ('users', 'api_keys', 'watchlists', 'credit_spreads'):
+        op.create_index(PRIMARY_KEY_INDEXES[table], table, ['id'], unique=False)
@@ -0,0 +1,52 @@
+"""Store mover and list types as a native enum
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-01-06 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+mover_type_enum = postgresql.ENUM('uptrend', 'downtrend', name='mover_type_enum')
+
+# (table, column) pairs holding 'uptrend'/'downtrend'
+MOVER_TYPE_COLUMNS = (
+    ('todays_movers', 'mover_type'),
+    ('main_lists', 'list_type'),
+)
+
+
+def upgrade() -> None:
+    mover_type_enum.create(op.get_bind(), checkfirst=True)
+    
+    for table, column in MOVER_TYPE_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=mover_type_enum,
+            existing_type=sa.String(length=20),
+            existing_nullable=False,
+            postgresql_using=f'{column}::mover_type_enum'
+        )
+
+
+def downgrade() -> None:
+    for table, column in MOVER_TYPE_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=20),
+            existing_type=mover_type_enum,
+            existing_nullable=False,
+            postgresql_using=f'{column}::text'
+        )
+    
+    mover_type_enum.drop(op.get_bind(), checkfirst=True)
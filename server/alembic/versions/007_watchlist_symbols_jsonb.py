@@ -0,0 +1,47 @@
+"""Store watchlist symbols as JSONB with a GIN index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-01-07 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'watchlists',
+        'symbols',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using='symbols::jsonb'
+    )
+    op.create_index(
+        'idx_watchlists_symbols_gin',
+        'watchlists',
+        ['symbols'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'symbols': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_watchlists_symbols_gin', table_name='watchlists')
+    op.alter_column(
+        'watchlists',
+        'symbols',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='symbols::json'
+    )
@@ -0,0 +1,40 @@
+"""Store credit spread scenarios as JSONB
+
+Revision ID: 008
+Revises: 007
+Create Date: 2024-01-08 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'credit_spreads',
+        'scenarios',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        existing_comment='Price scenarios JSON',
+        postgresql_using='scenarios::jsonb'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'credit_spreads',
+        'scenarios',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        existing_comment='Price scenarios JSON',
+        postgresql_using='scenarios::json'
+    )
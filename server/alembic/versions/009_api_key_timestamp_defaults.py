@@ -0,0 +1,38 @@
+"""Add now() defaults to api_keys timestamps
+
+Revision ID: 009
+Revises: 008
+Create Date: 2024-01-09 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # APIKey timestamps are generated by the database, not the ORM
+    for column in ('created_at', 'updated_at'):
+        op.alter_column(
+            'api_keys',
+            column,
+            server_default=sa.text('now()'),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False
+        )
+
+
+def downgrade() -> None:
+    for column in ('created_at', 'updated_at'):
+        op.alter_column(
+            'api_keys',
+            column,
+            server_default=None,
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False
+        )
@@ -7,7 +7,6 @@ from datetime import datetime, timedelta
 
 from app.core.database import get_db
 from app.models.claims import Claims
-from app.models.stocks import MainList
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -1,12 +1,13 @@
+import math
 import time
-import uuid
-from typing import Dict, Optional
-from collections import defaultdict
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.trustedhost import TrustedHostMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.core.logging import get_logger, set_request_id, set_user_id, clear_context
+from app.core.logging import get_logger, set_request_id, set_user_id, clear_context, generate_request_id
 from app.core.responses import rate_limit_error
 from app.core.monitoring import ErrorMonitoring
 from app.core.config import settings
@@ -15,18 +16,91 @@ from app.core.config import settings
 logger = get_logger(__name__)
 
 
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware that sets the request ID context and adds the
+    X-Request-ID and X-Process-Time response headers
+    
+    Implemented without BaseHTTPMiddleware, which routes every request
+    through an extra task and memory stream.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+            
+        start_time = time.perf_counter()
+        request_id = generate_request_id()
+        set_request_id(request_id)
+        
+        # Store in request state for access in endpoints
+        scope.setdefault("state", {})["request_id"] = request_id
+        
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Process-Time"] = f"{(time.perf_counter() - start_time) * 1000:.2f}"
+            await send(message)
+            
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            clear_context()
+
+
+class FastTrustedHostMiddleware(TrustedHostMiddleware):
+    """
+    TrustedHostMiddleware with constant-time exact host matching
+    
+    Exact hosts are kept in a frozenset and wildcard patterns as a suffix
+    tuple for a single str.endswith call. Hosts that match neither fall
+    through to the parent, which handles the www redirect and the 400.
+    """
+    
+    def __init__(self, app: ASGIApp, allowed_hosts=None, www_redirect: bool = True):
+        super().__init__(app, allowed_hosts=allowed_hosts, www_redirect=www_redirect)
+        self._exact_hosts = frozenset(
+            pattern for pattern in self.allowed_hosts if not pattern.startswith("*")
+        )
+        self._host_suffixes = tuple(
+            pattern[1:] for pattern in self.allowed_hosts if pattern.startswith("*.")
+        )
+        
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] in ("http", "websocket") and not self.allow_any:
+            host = ""
+            for name, value in scope["headers"]:
+                if name == b"host":
+                    host = value.decode("latin-1").split(":", 1)[0]
+                    break
+            if host in self._exact_hosts or (self._host_suffixes and host.endswith(self._host_suffixes)):
+                await self.app(scope, receive, send)
+                return
+                
+        await super().__call__(scope, receive, send)
+
+
 class LoggingMiddleware(BaseHTTPMiddleware):
     """
     Middleware to log all requests and responses
     """
     
     async def dispatch(self, request: Request, call_next):
-        # Generate request ID if not present
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        # Reuse the request ID assigned by RequestContextMiddleware
+        request_id = (
+            getattr(request.state, "request_id", None)
+            or request.headers.get("X-Request-ID")
+            or generate_request_id()
+        )
         set_request_id(request_id)
         
         # Extract user ID from auth header or token (implement based on your auth)
-        user_id = self._extract_user_id(request)
+        user_id = await self._extract_user_id(request)
         if user_id:
             set_user_id(user_id)
             
@@ -71,10 +145,6 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 request_id=request_id
             )
             
-            # Add response headers
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Process-Time"] = str(round(process_time * 1000, 2))
-            
             return response
             
         except Exception as e:
@@ -96,17 +166,17 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             # Clear context
             clear_context()
             
-    def _extract_user_id(self, request: Request) -> Optional[str]:
+    async def _extract_user_id(self, request: Request) -> Optional[str]:
         """
         Extract user ID from request using JWT token
         """
-        from app.core.security import verify_jwt_token, extract_token_from_header
+        from app.core.security import verify_jwt_token_async, extract_token_from_header
         
         auth_header = request.headers.get("Authorization", "")
         token = extract_token_from_header(auth_header)
         
         if token:
-            jwt_payload = verify_jwt_token(token)
+            jwt_payload = await verify_jwt_token_async(token)
             if jwt_payload:
                 # Store JWT payload in request state for later use
                 request.state.jwt_payload = jwt_payload
@@ -117,32 +187,40 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
-    Simple rate limiting middleware
+    Per-client token bucket rate limiting
+    
+    Each client IP gets a bucket holding up to rate_limit_requests tokens,
+    refilled continuously at rate_limit_requests per rate_limit_period.
+    A request spends one token, so checking the limit is O(1) instead of
+    rescanning a list of request timestamps.
     """
     
     def __init__(self, app):
         super().__init__(app)
-        # Store request counts by IP
-        self.requests: Dict[str, list] = defaultdict(list)
-        self.cleanup_interval = 60  # Cleanup old entries every minute
-        self.last_cleanup = datetime.now()
+        self.capacity = float(settings.api.rate_limit_requests)
+        self.refill_rate = self.capacity / settings.api.rate_limit_period  # tokens per second
+        # Buckets by IP: [tokens, last refill (monotonic)]
+        self.buckets: Dict[str, List[float]] = {}
+        self.cleanup_interval = 60  # Cleanup idle buckets every minute
+        self.last_cleanup = time.monotonic()
         
     async def dispatch(self, request: Request, call_next):
         # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/", f"{settings.api.prefix}/health"]:
+        if request.url.path in ("/health", "/", f"{settings.api.prefix}/health"):
             return await call_next(request)
             
         # Get client IP
         client_ip = request.client.host if request.client else "unknown"
         
-        # Cleanup old entries periodically
-        now = datetime.now()
-        if (now - self.last_cleanup).seconds > self.cleanup_interval:
-            self._cleanup_old_entries()
+        # Cleanup idle buckets periodically
+        now = time.monotonic()
+        if now - self.last_cleanup > self.cleanup_interval:
+            self._cleanup_old_entries(now)
             self.last_cleanup = now
             
         # Check rate limit
-        if not self._check_rate_limit(client_ip):
+        tokens = self._take_token(client_ip, now)
+        if tokens is None:
             logger.warning(
                 "Rate limit exceeded",
                 client_ip=client_ip,
@@ -161,84 +239,47 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
         
         # Add rate limit headers
-        remaining = self._get_remaining_requests(client_ip)
         response.headers["X-RateLimit-Limit"] = str(settings.api.rate_limit_requests)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(self._get_reset_time(client_ip).timestamp()))
+        response.headers["X-RateLimit-Remaining"] = str(int(tokens))
+        response.headers["X-RateLimit-Reset"] = str(int(time.time() + (self.capacity - tokens) / self.refill_rate))
         
         return response
         
-    def _check_rate_limit(self, client_ip: str) -> bool:
-        """
-        Check if request is within rate limit
-        """
-        now = datetime.now()
-        window_start = now - timedelta(seconds=settings.api.rate_limit_period)
-        
-        # Get requests in current window
-        self.requests[client_ip] = [
-            req_time for req_time in self.requests[client_ip]
-            if req_time > window_start
-        ]
-        
-        # Check if under limit
-        if len(self.requests[client_ip]) >= settings.api.rate_limit_requests:
-            return False
-            
-        # Add current request
-        self.requests[client_ip].append(now)
-        return True
-        
-    def _get_remaining_requests(self, client_ip: str) -> int:
-        """
-        Get remaining requests in current window
+    def _take_token(self, client_ip: str, now: float) -> Optional[float]:
         """
-        now = datetime.now()
-        window_start = now - timedelta(seconds=settings.api.rate_limit_period)
+        Spend one token from the client's bucket
         
-        current_requests = len([
-            req_time for req_time in self.requests[client_ip]
-            if req_time > window_start
-        ])
-        
-        return max(0, settings.api.rate_limit_requests - current_requests)
-        
-    def _get_reset_time(self, client_ip: str) -> datetime:
-        """
-        Get time when rate limit resets
+        Returns the tokens left afterwards, or None if the bucket is empty
         """
-        if not self.requests[client_ip]:
-            return datetime.now()
+        bucket = self.buckets.get(client_ip)
+        if bucket is None:
+            bucket = self.buckets[client_ip] = [self.capacity, now]
+        else:
+            bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.refill_rate)
+            bucket[1] = now
             
-        # Find oldest request in current window
-        oldest_request = min(self.requests[client_ip])
-        return oldest_request + timedelta(seconds=settings.api.rate_limit_period)
+        if bucket[0] < 1:
+            return None
+        bucket[0] -= 1
+        return bucket[0]
         
     def _get_retry_after(self, client_ip: str) -> int:
         """
-        Get seconds until rate limit resets
+        Get seconds until the client's next token is available
         """
-        reset_time = self._get_reset_time(client_ip)
-        retry_after = (reset_time - datetime.now()).total_seconds()
-        return max(1, int(retry_after))
+        bucket = self.buckets.get(client_ip)
+        if bucket is None:
+            return 1
+        return max(1, math.ceil((1 - bucket[0]) / self.refill_rate))
         
-    def _cleanup_old_entries(self):
+    def _cleanup_old_entries(self, now: float):
         """
-        Remove old entries to prevent memory growth
+        Drop buckets that have refilled completely to prevent memory growth
         """
-        now = datetime.now()
-        window_start = now - timedelta(seconds=settings.api.rate_limit_period)
-        
-        # Clean up IPs with no recent requests
-        empty_ips = []
-        for ip, requests in self.requests.items():
-            self.requests[ip] = [
-                req_time for req_time in requests
-                if req_time > window_start
-            ]
-            if not self.requests[ip]:
-                empty_ips.append(ip)
-                
-        # Remove empty entries
-        for ip in empty_ips:
-            del self.requests[ip]
\ No newline at end of file
+        full_after = self.capacity / self.refill_rate
+        idle_ips = [
+            ip for ip, (_, last_refill) in self.buckets.items()
+            if now - last_refill >= full_after
+        ]
+        for ip in idle_ips:
+            del self.buckets[ip]
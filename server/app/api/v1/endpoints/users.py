@@ -6,10 +6,10 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from passlib.context import CryptContext  # type: ignore[import-untyped]
 
 from app.core.dependencies import get_db, require_database
 from app.core.responses import create_success_response
+from app.core.security import get_password_hash
 from app.core.cache import redis_cache
 from app.models.user import User
 from app.utils.database import DatabaseCRUD, PaginationParams
@@ -21,7 +21,6 @@ from app.schemas.user import (
 )
 
 router = APIRouter()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # Create CRUD instance for User model
 user_crud = DatabaseCRUD[User](User)
@@ -42,7 +41,7 @@ async def create_user(
         raise HTTPException(status_code=400, detail="Username already taken")
     
     # Hash password
-    hashed_password = pwd_context.hash(user_in.password)
+    hashed_password = get_password_hash(user_in.password)
     
     # Create user
     user_data = user_in.dict(exclude={"password"})
@@ -136,7 +135,7 @@ async def update_user(
     
     # Hash password if provided
     if "password" in update_data:
-        update_data["hashed_password"] = pwd_context.hash(update_data.pop("password"))
+        update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
     
     # Update timestamp
     update_data["updated_at"] = datetime.utcnow()
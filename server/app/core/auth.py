@@ -1,12 +1,11 @@
 """
 Authentication dependencies for FastAPI endpoints
 """
-from typing import Optional, Callable
-from functools import wraps
-from fastapi import Depends, HTTPException, status, Request, Query
+from typing import Optional
+from fastapi import Depends, HTTPException, status, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from app.core.security import verify_jwt_token, extract_token_from_header, JWTPayload, validate_subscription
+from app.core.security import verify_jwt_token_async, JWTPayload
 from app.core.logging import get_logger
 from app.core.database import get_db
 from app.core.config import settings
@@ -74,6 +73,12 @@ async def get_current_user_jwt(
     """
     Get current user from JWT token (no database lookup)
 
+    Token verification for every auth dependency goes through here.
+    get_current_user and optional_user take the result through Depends,
+    which FastAPI caches per request. The conditional dependencies call it
+    directly, and only once ENABLE_AUTH is on and a token is present; a
+    repeat verification of the same token is a VerifiedTokenCache hit.
+
     Args:
         token: JWT token from request
 
@@ -83,7 +88,7 @@ async def get_current_user_jwt(
     if not token:
         return None
 
-    jwt_payload = verify_jwt_token(token)
+    jwt_payload = await verify_jwt_token_async(token)
 
     if not jwt_payload:
         return None
@@ -198,171 +203,6 @@ async def get_current_superuser(
     return current_user
 
 
-def require_auth(f: Callable) -> Callable:
-    """
-    Decorator to require authentication for an endpoint
-    
-    Usage:
-        @router.get("/protected")
-        @require_auth
-        async def protected_endpoint(request: Request):
-            user = request.state.user
-            return {"user_id": user.id}
-    """
-    @wraps(f)
-    async def decorated_function(request: Request, *args, **kwargs):
-        # Get token from header
-        auth_header = request.headers.get("Authorization", "")
-        token = extract_token_from_header(auth_header)
-        
-        if not token:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Missing authentication token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # Verify token
-        jwt_payload = verify_jwt_token(token)
-        if not jwt_payload:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # Add user to request state
-        request.state.jwt_payload = jwt_payload
-        
-        return await f(request, *args, **kwargs)
-    
-    return decorated_function
-
-
-def optional_auth(f: Callable) -> Callable:
-    """
-    Decorator for optional authentication
-    
-    Usage:
-        @router.get("/public")
-        @optional_auth
-        async def public_endpoint(request: Request):
-            user = getattr(request.state, 'jwt_payload', None)
-            if user:
-                return {"message": f"Hello {user.user_id}"}
-            return {"message": "Hello anonymous"}
-    """
-    @wraps(f)
-    async def decorated_function(request: Request, *args, **kwargs):
-        # Get token from header
-        auth_header = request.headers.get("Authorization", "")
-        token = extract_token_from_header(auth_header)
-        
-        if token:
-            # Verify token if present
-            jwt_payload = verify_jwt_token(token)
-            if jwt_payload:
-                request.state.jwt_payload = jwt_payload
-        
-        return await f(request, *args, **kwargs)
-    
-    return decorated_function
-
-
-def require_subscription(subscription: str) -> Callable:
-    """
-    Decorator to require specific subscription
-    
-    Usage:
-        @router.get("/premium")
-        @require_subscription("PREMIUM")
-        async def premium_endpoint(request: Request):
-            return {"message": "Premium content"}
-    """
-    def decorator(f: Callable) -> Callable:
-        @wraps(f)
-        async def decorated_function(request: Request, *args, **kwargs):
-            # First check authentication
-            auth_header = request.headers.get("Authorization", "")
-            token = extract_token_from_header(auth_header)
-            
-            if not token:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Missing authentication token",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
-            # Verify token
-            jwt_payload = verify_jwt_token(token)
-            if not jwt_payload:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid or expired token",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
-            # Check subscription
-            if not validate_subscription(jwt_payload, required_subscription=subscription):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Subscription '{subscription}' required"
-                )
-            
-            request.state.jwt_payload = jwt_payload
-            return await f(request, *args, **kwargs)
-        
-        return decorated_function
-    return decorator
-
-
-def require_scopes(*scopes: str) -> Callable:
-    """
-    Decorator to require specific scopes
-    
-    Usage:
-        @router.post("/admin/action")
-        @require_scopes("admin:write", "admin:delete")
-        async def admin_action(request: Request):
-            return {"message": "Admin action performed"}
-    """
-    def decorator(f: Callable) -> Callable:
-        @wraps(f)
-        async def decorated_function(request: Request, *args, **kwargs):
-            # First check authentication
-            auth_header = request.headers.get("Authorization", "")
-            token = extract_token_from_header(auth_header)
-            
-            if not token:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Missing authentication token",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
-            # Verify token
-            jwt_payload = verify_jwt_token(token)
-            if not jwt_payload:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid or expired token",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            
-            # Check scopes
-            if not validate_subscription(jwt_payload, required_scopes=list(scopes)):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Required scopes: {', '.join(scopes)}"
-                )
-            
-            request.state.jwt_payload = jwt_payload
-            return await f(request, *args, **kwargs)
-        
-        return decorated_function
-    return decorator
-
-
 # Dependency for use in path operations
 async def optional_user(
     jwt_payload: Optional[JWTPayload] = Depends(get_current_user_jwt),
@@ -420,8 +260,8 @@ async def conditional_jwt_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    jwt_payload = verify_jwt_token(token)
-
+    # Verified only once auth is known to be enabled and a token is present
+    jwt_payload = await get_current_user_jwt(token)
     if not jwt_payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -478,8 +318,8 @@ async def conditional_jwt_token_vip(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    jwt_payload = verify_jwt_token(token)
-
+    # Verified only once auth is known to be enabled and a token is present
+    jwt_payload = await get_current_user_jwt(token)
     if not jwt_payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -532,8 +372,8 @@ async def public_jwt_token(
         return None
 
     # If token is provided, it must be valid
-    jwt_payload = verify_jwt_token(token)
-
+    # Verified only once auth is known to be enabled and a token is present
+    jwt_payload = await get_current_user_jwt(token)
     if not jwt_payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -3,16 +3,104 @@ Redis Cache Utility
 Provides caching functionality for API responses with TTL support
 """
 
-import json
 import logging
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Union
 from datetime import datetime
+from decimal import Decimal
 from urllib.parse import urlparse
+import msgspec
+import orjson
 import redis
+import zstandard
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# orjson options: serialize naive datetimes as UTC and keep non-string dict
+# keys working the same way stdlib json did
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _encode_default(obj: Any) -> Any:
+    """
+    Encode types the serializers don't handle natively.
+
+    Only plain data is cached; anything else raises TypeError so the bug
+    shows up when the value is written rather than as a corrupt entry later.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not cache-serializable: {type(obj).__name__}")
+
+
+class CachedCreditSpread(msgspec.Struct, array_like=True):
+    """Cached credit spread analysis payload (mirrors CreditSpreadResponse)"""
+    success: bool
+    ticker: str
+    current_stock_price: float
+    trend: str
+    spread_analysis: Optional[Dict[str, Any]]
+    market_context: Dict[str, Any]
+    timestamp: str
+    message: Optional[str] = None
+
+
+_spread_encoder = msgspec.msgpack.Encoder(enc_hook=_encode_default)
+_spread_decoder = msgspec.msgpack.Decoder(CachedCreditSpread)
+
+
+def _decode_spread(data: bytes) -> Dict[str, Any]:
+    """Decode a cached credit spread back into the response dict shape"""
+    return msgspec.structs.asdict(_spread_decoder.decode(data))
+
+
+# Payloads at or above this size are zstd-compressed before hitting Redis
+_COMPRESS_THRESHOLD = 4096
+
+_compressor = zstandard.ZstdCompressor(level=1)
+_decompressor = zstandard.ZstdDecompressor()
+
+
+def _decode_compressed(data: bytes) -> Any:
+    """Decompress a payload and decode the codec-marked value inside it"""
+    return _deserialize(_decompressor.decompress(data))
+
+
+# One-byte codec markers written in front of every cached payload so the
+# reader can pick the decoder directly instead of trial-decoding
+_CODEC_JSON = b"J"
+_CODEC_SPREAD = b"S"
+_CODEC_ZSTD = b"Z"
+
+_DECODERS = {
+    _CODEC_JSON: orjson.loads,
+    _CODEC_SPREAD: _decode_spread,
+    _CODEC_ZSTD: _decode_compressed,
+}
+
+
+def _serialize(value: Any) -> bytes:
+    """Encode a value for storage, prefixed with its codec marker"""
+    if type(value) is CachedCreditSpread:
+        data = _CODEC_SPREAD + _spread_encoder.encode(value)
+    else:
+        data = _CODEC_JSON + orjson.dumps(value, default=_encode_default, option=_ORJSON_OPTIONS)
+    
+    if len(data) >= _COMPRESS_THRESHOLD:
+        return _CODEC_ZSTD + _compressor.compress(data)
+    return data
+
+
+def _deserialize(data: bytes) -> Any:
+    """Decode a stored payload by dispatching on its codec marker"""
+    decoder = _DECODERS.get(data[:1])
+    if decoder is None:
+        # Entries written before codec markers were introduced are plain JSON
+        return orjson.loads(data)
+    return decoder(data[1:])
+
 
 class RedisCache:
     """Redis cache manager with TTL support"""
@@ -21,31 +109,29 @@ class RedisCache:
         """Initialize Redis connection"""
         if not settings.enable_caching:
             logger.info("Caching is disabled")
+            self.pool = None
             self.redis_client = None
             self._connected = False
             return
             
         try:
-            # Parse Redis URL if provided
-            if settings.redis_url:
-                self.redis_client = redis.from_url(
-                    settings.redis_url,
-                    decode_responses=True
-                )
-            else:
-                # Fallback to localhost for development
-                self.redis_client = redis.Redis(
-                    host="localhost",
-                    port=6379,
-                    db=0,
-                    decode_responses=True
-                )
+            # Bounded pool shared by every request and worker thread,
+            # falling back to localhost for development
+            self.pool = redis.ConnectionPool.from_url(
+                settings.redis_url or "redis://localhost:6379/0",
+                max_connections=settings.cache.max_connections,
+                socket_keepalive=True,
+                health_check_interval=settings.cache.health_check_interval,
+                decode_responses=False
+            )
+            self.redis_client = redis.Redis(connection_pool=self.pool)
             # Test connection
             self.redis_client.ping()
             self._connected = True
             logger.info("Redis cache connected successfully")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
+            self.pool = None
             self.redis_client = None
             self._connected = False
     
@@ -56,15 +142,15 @@ class RedisCache:
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
-        if not self.redis_client or not settings.enable_caching:
+        if self.redis_client is None:
             return None
         
         try:
             value = self.redis_client.get(key)
             if value:
-                logger.info(f"Cache hit: {key}")
-                return json.loads(value)
-            logger.info(f"Cache miss: {key}")
+                logger.debug("Cache hit: %s", key)
+                return _deserialize(value)
+            logger.debug("Cache miss: %s", key)
             return None
         except Exception as e:
             logger.error(f"Cache get error: {e}")
@@ -72,13 +158,12 @@ class RedisCache:
     
     def set(self, key: str, value: Any, ttl: int = 60) -> bool:
         """Set value in cache with TTL in seconds"""
-        if not self.redis_client or not settings.enable_caching:
+        if self.redis_client is None:
             return False
         
         try:
-            json_value = json.dumps(value)
-            self.redis_client.setex(key, ttl, json_value)
-            logger.info(f"Cache set: {key} (TTL: {ttl}s)")
+            self.redis_client.setex(key, ttl, _serialize(value))
+            logger.debug("Cache set: %s (TTL: %ss)", key, ttl)
             return True
         except Exception as e:
             logger.error(f"Cache set error: {e}")
@@ -86,13 +171,13 @@ class RedisCache:
     
     def delete(self, key: str) -> bool:
         """Delete key from cache"""
-        if not self.redis_client or not settings.enable_caching:
+        if self.redis_client is None:
             return False
         
         try:
-            result = self.redis_client.delete(key)
+            result = self.redis_client.unlink(key)
             if result:
-                logger.info(f"Cache deleted: {key}")
+                logger.debug("Cache deleted: %s", key)
             return bool(result)
         except Exception as e:
             logger.error(f"Cache delete error: {e}")
@@ -100,7 +185,7 @@ class RedisCache:
     
     def exists(self, key: str) -> bool:
         """Check if key exists in cache"""
-        if not self.redis_client or not settings.enable_caching:
+        if self.redis_client is None:
             return False
         
         try:
@@ -111,7 +196,7 @@ class RedisCache:
     
     def get_ttl(self, key: str) -> int:
         """Get remaining TTL for a key in seconds"""
-        if not self.redis_client or not settings.enable_caching:
+        if self.redis_client is None:
             return -1
         
         try:
@@ -123,14 +208,14 @@ class RedisCache:
     
     def flush_pattern(self, pattern: str) -> int:
         """Delete all keys matching a pattern"""
-        if not self.redis_client or not settings.enable_caching:
+        if self.redis_client is None:
             return 0
         
         try:
             keys = self.redis_client.keys(pattern)
             if keys:
-                deleted = self.redis_client.delete(*keys)
-                logger.info(f"Cache flush: {deleted} keys matching {pattern}")
+                deleted = self.redis_client.unlink(*keys)
+                logger.debug("Cache flush: %s keys matching %s", deleted, pattern)
                 return deleted
             return 0
         except Exception as e:
@@ -146,9 +231,16 @@ class CreditSpreadCache:
         self.prefix = "credit_spread"
         self.ttl = 60  # 60 seconds cache duration
     
+    def _make_key(self, ticker: str, trend: str) -> str:
+        """Build the cache key directly (same layout as RedisCache.generate_key)"""
+        return f"{self.prefix}:{ticker.lower()}:{trend.lower()}"
+    
     def get_spread_result(self, ticker: str, trend: str) -> Optional[Dict]:
         """Get cached credit spread result"""
-        key = self.cache.generate_key(self.prefix, ticker, trend)
+        if self.cache.redis_client is None:
+            return None
+        
+        key = self._make_key(ticker, trend)
         cached_data = self.cache.get(key)
         
         if cached_data:
@@ -157,22 +249,32 @@ class CreditSpreadCache:
             if 'market_context' in cached_data:
                 cached_data['market_context']['cache_hit'] = True
             
-            # Get remaining TTL
-            ttl = self.cache.get_ttl(key)
-            if ttl > 0:
-                logger.info(f"Credit spread cache hit: {ticker} {trend} (expires in {ttl}s)")
+            # Remaining TTL costs an extra Redis round-trip, only fetch it for debug output
+            if logger.isEnabledFor(logging.DEBUG):
+                ttl = self.cache.get_ttl(key)
+                if ttl > 0:
+                    logger.debug("Credit spread cache hit: %s %s (expires in %ss)", ticker, trend, ttl)
             
             return cached_data
         
         return None
     
-    def set_spread_result(self, ticker: str, trend: str, result: Dict) -> bool:
+    def set_spread_result(self, ticker: str, trend: str, result: Union[Dict, CachedCreditSpread]) -> bool:
         """Cache credit spread result"""
-        key = self.cache.generate_key(self.prefix, ticker, trend)
+        if self.cache.redis_client is None:
+            return False
+        
+        key = self._make_key(ticker, trend)
+        if not isinstance(result, CachedCreditSpread):
+            try:
+                result = CachedCreditSpread(**result)
+            except TypeError as e:
+                logger.debug("Credit spread not cached, unexpected result shape: %s", e)
+                return False
         success = self.cache.set(key, result, self.ttl)
         
         if success:
-            logger.info(f"Credit spread cached: {ticker} {trend} (60s TTL)")
+            logger.debug("Credit spread cached: %s %s (%ss TTL)", ticker, trend, self.ttl)
         
         return success
     
@@ -197,6 +299,23 @@ class CreditSpreadCache:
         return deleted
 
 
+def _pool_stats(pool) -> Dict[str, Any]:
+    """
+    Connection pool stats for get_metrics
+    
+    These come from private redis-py attributes, so each one is read
+    defensively and reported as None if a redis upgrade removes it.
+    """
+    in_use = getattr(pool, "_in_use_connections", None)
+    available = getattr(pool, "_available_connections", None)
+    return {
+        "max_connections": getattr(pool, "max_connections", None),
+        "created_connections": getattr(pool, "_created_connections", None),
+        "in_use_connections": len(in_use) if in_use is not None else None,
+        "available_connections": len(available) if available is not None else None
+    }
+
+
 class CacheManager:
     """Cache manager with connection state tracking"""
     
@@ -219,12 +338,14 @@ class CacheManager:
         
         try:
             info = self.cache.redis_client.info()
+            pool = self.cache.pool
             return {
                 "status": "connected",
                 "memory_used": info.get("used_memory_human", "unknown"),
                 "connected_clients": info.get("connected_clients", 0),
                 "keyspace_hits": info.get("keyspace_hits", 0),
-                "keyspace_misses": info.get("keyspace_misses", 0)
+                "keyspace_misses": info.get("keyspace_misses", 0),
+                "pool": _pool_stats(pool)
             }
         except Exception as e:
             logger.error(f"Error getting cache metrics: {e}")
@@ -232,11 +353,11 @@ class CacheManager:
     
     async def disconnect(self):
         """Disconnect from cache"""
-        if self._cache and self._cache.redis_client:
+        if self._cache and self._cache.pool:
             try:
-                await self._cache.redis_client.aclose()
-            except:
-                pass
+                self._cache.pool.disconnect(inuse_connections=True)
+            except Exception as e:
+                logger.warning(f"Error closing Redis connection pool: {e}")
         self._connected = False
 
 # Global cache instances
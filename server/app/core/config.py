@@ -1,9 +1,86 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Mapping, Tuple, Type
 from pathlib import Path
+from types import MappingProxyType
 import os
-from pydantic import BaseModel, Field, validator, model_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
+from cryptography.hazmat.primitives import serialization
+from pydantic import BaseModel, Field, model_validator
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+from functools import cached_property, lru_cache
+
+
+# JWT RSA Public Key for verification (from one-click trading service)
+_DEFAULT_JWT_PUBLIC_KEY = """-----BEGIN PUBLIC KEY-----
+MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEAtSt0xH5N6SOVXY4E2h1X
+WE6edernQCmw2kfg6023C64hYR4PZH8XM2P9qoyAzq19UDJZbVj4hi/75GKHEFBC
+zL+SrJLgc/6jZoMpOYtEhDgzEKKdfFtgpGD18Idc5IyvBLeW2d8gvfIJMuxRUnT6
+K3spmisjdZtd+7bwMKPl6BGAsxZbhlkGjLI1gP/fHrdfU2uoL5okxbbzg1NH95xc
+LSXX2JJ+q//t8vLGy+zMh8HPqFM9ojsxzT97AiR7uZZPBvR6c/rX5GDIFPvo5QVr
+crCucCyTMeYqwyGl14zN0rArFi6eFXDn+JWTs3Qf04F8LQn7TiwxKV9KRgPHYFtG
+qwIDAQAB
+-----END PUBLIC KEY-----"""
+
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+_DEVELOPMENT_ORIGINS = (
+    "http://localhost:3000",
+    "http://localhost:3001",
+    "http://127.0.0.1:3000",
+    "http://127.0.0.1:3001",
+)
+
+# Known Railway frontend domains, allowed in production
+_KNOWN_RAILWAY_DOMAINS = (
+    "https://cashflowagent-vip-production.up.railway.app",
+    "https://cfa-frontend-production.up.railway.app",
+    "https://client2-production.up.railway.app",
+)
+
+
+def _with_scheme(url: str) -> str:
+    """Default bare hostnames to https://"""
+    if url.startswith(("http://", "https://")):
+        return url
+    return f"https://{url}"
+
+
+# Resolved once so the path (and the .env memoization key below) is stable
+# regardless of the working directory
+_ENV_FILE = str(Path(__file__).resolve().parent.parent.parent / ".env")
+
+# Parsed .env contents keyed on (path, mtime) so re-instantiating Settings
+# (tests, workers, CLI scripts) doesn't re-read and re-parse the file
+_dotenv_cache: Dict[Tuple[Any, ...], Mapping[str, Optional[str]]] = {}
+
+
+class _CachedDotEnvSettingsSource(DotEnvSettingsSource):
+    """DotEnvSettingsSource that memoizes parsed env files until they change"""
+    
+    def _read_env_files(self, *args: Any, **kwargs: Any) -> Mapping[str, Optional[str]]:
+        env_files = self.env_file
+        if env_files is None:
+            return {}
+        if isinstance(env_files, (str, os.PathLike)):
+            env_files = [env_files]
+        
+        stamps = []
+        for env_file in env_files:
+            path = os.path.expanduser(env_file)
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime = None
+            stamps.append((path, mtime))
+        
+        key = (tuple(stamps), self.case_sensitive, args, tuple(sorted(kwargs.items())))
+        env_vars = _dotenv_cache.get(key)
+        if env_vars is None:
+            env_vars = _dotenv_cache[key] = super()._read_env_files(*args, **kwargs)
+        return dict(env_vars)
 
 
 class LoggingConfig(BaseModel):
@@ -29,6 +106,10 @@ class CacheConfig(BaseModel):
     namespace_separator: str = ":"
     key_prefix: str = "app"
     
+    # Connection pool
+    max_connections: int = 100
+    health_check_interval: int = 30  # seconds
+    
     # TTL by data type
     ttl_mapping: Dict[str, int] = {
         "market_data": 60,      # 1 minute
@@ -45,13 +126,6 @@ class DatabaseConfig(BaseModel):
     max_overflow: int = 20
     pool_timeout: int = 30
     pool_recycle: int = 1800
-    
-    @validator("echo", pre=True)
-    def validate_echo(cls, v, values):
-        # Force echo to False in production
-        if os.getenv("ENVIRONMENT") == "production":
-            return False
-        return v
 
 
 class APIConfig(BaseModel):
@@ -77,17 +151,6 @@ class SecurityConfig(BaseModel):
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
     
-    # JWT RSA Public Key for verification (from one-click trading service)
-    jwt_public_key: str = """-----BEGIN PUBLIC KEY-----
-MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEAtSt0xH5N6SOVXY4E2h1X
-WE6edernQCmw2kfg6023C64hYR4PZH8XM2P9qoyAzq19UDJZbVj4hi/75GKHEFBC
-zL+SrJLgc/6jZoMpOYtEhDgzEKKdfFtgpGD18Idc5IyvBLeW2d8gvfIJMuxRUnT6
-K3spmisjdZtd+7bwMKPl6BGAsxZbhlkGjLI1gP/fHrdfU2uoL5okxbbzg1NH95xc
-LSXX2JJ+q//t8vLGy+zMh8HPqFM9ojsxzT97AiR7uZZPBvR6c/rX5GDIFPvo5QVr
-crCucCyTMeYqwyGl14zN0rArFi6eFXDn+JWTs3Qf04F8LQn7TiwxKV9KRgPHYFtG
-qwIDAQAB
------END PUBLIC KEY-----"""
-    
     # OAuth Configuration (removed - using simple JWT verification)
     # oauth_client_id: Optional[str] = None
     # oauth_client_secret: Optional[str] = None
@@ -100,6 +163,16 @@ qwIDAQAB
     allowed_methods: List[str] = ["GET", "POST", "PUT", "DELETE", "PATCH"]
     allowed_headers: List[str] = ["*"]
     allow_credentials: bool = True
+    
+    @cached_property
+    def jwt_public_key(self) -> str:
+        """JWT RSA public key, resolved on first use (JWT_PUBLIC_KEY overrides the default)"""
+        return os.getenv("JWT_PUBLIC_KEY") or _DEFAULT_JWT_PUBLIC_KEY
+    
+    @cached_property
+    def jwt_verification_key(self) -> Any:
+        """jwt_public_key parsed once, so verification doesn't re-parse the PEM"""
+        return serialization.load_pem_public_key(self.jwt_public_key.encode())
 
 
 class Settings(BaseSettings):
@@ -110,11 +183,11 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False, validation_alias="DEBUG")
     
     # API Configuration
-    api: APIConfig = APIConfig()
+    api: APIConfig = Field(default_factory=APIConfig)
     
     # Security
     secret_key: str = Field(..., validation_alias="SECRET_KEY")
-    security: SecurityConfig = SecurityConfig()
+    security: SecurityConfig = Field(default_factory=SecurityConfig)
     
     # Frontend URLs (comma-separated for multiple frontends)
     frontend_url: Optional[str] = Field(None, validation_alias="FRONTEND_URL")
@@ -122,12 +195,12 @@ class Settings(BaseSettings):
     
     # Database
     database_url: Optional[str] = Field(None, validation_alias="DATABASE_URL")
-    database: DatabaseConfig = DatabaseConfig()
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     enable_database: bool = Field(default=True, validation_alias="ENABLE_DATABASE")
     
     # Redis
     redis_url: Optional[str] = Field(None, validation_alias="REDIS_URL")
-    cache: CacheConfig = CacheConfig()
+    cache: CacheConfig = Field(default_factory=CacheConfig)
     enable_caching: bool = Field(default=True, validation_alias="ENABLE_CACHING")
     
     # External APIs
@@ -149,7 +222,7 @@ class Settings(BaseSettings):
     external_api_retry_count: int = Field(default=3, validation_alias="EXTERNAL_API_RETRY_COUNT")
     
     # Logging
-    logging: LoggingConfig = LoggingConfig()
+    logging: LoggingConfig = Field(default_factory=LoggingConfig)
     
     # Sentry
     sentry_dsn: Optional[str] = Field(None, validation_alias="SENTRY_DSN")
@@ -176,12 +249,33 @@ class Settings(BaseSettings):
     }
     
     model_config = SettingsConfigDict(
-        env_file=str(Path(__file__).parent.parent.parent / ".env"),
+        # The .env file is read through _CachedDotEnvSettingsSource, see settings_customise_sources
+        env_file=None,
         env_file_encoding="utf-8",
         case_sensitive=True,
-        extra="allow"
+        extra="allow",
+        # Settings are read-only after startup: skip assignment validation,
+        # instance revalidation and mutation bookkeeping
+        frozen=True,
+        validate_assignment=False,
+        revalidate_instances="never",
     )
     
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Read the default .env file through the memoizing source"""
+        # An explicit Settings(_env_file=...) override keeps the stock source
+        if getattr(dotenv_settings, "env_file", None) is None:
+            dotenv_settings = _CachedDotEnvSettingsSource(settings_cls, env_file=_ENV_FILE)
+        return init_settings, env_settings, dotenv_settings, file_secret_settings
+    
     @model_validator(mode='after')
     def validate_database_config(self):
         """Validate database configuration"""
@@ -196,69 +290,54 @@ class Settings(BaseSettings):
             raise ValueError("REDIS_URL is required when ENABLE_CACHING=true")
         return self
     
-    @property
+    @model_validator(mode='after')
+    def force_echo_off_in_production(self):
+        """Never echo SQL in production"""
+        if self.environment == "production" and self.database.echo:
+            self.database.echo = False
+        return self
+    
+    @cached_property
     def async_database_url(self) -> Optional[str]:
-        """Convert sync DATABASE_URL to async format for SQLAlchemy"""
+        """Convert sync DATABASE_URL to async format for SQLAlchemy (computed once)"""
         if not self.database_url:
             return None
         if self.database_url.startswith("postgresql://"):
-            return self.database_url.replace("postgresql://", "postgresql+asyncpg://")
+            return self.database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
         return self.database_url
     
-    @property
+    @cached_property
     def cors_origins(self) -> List[str]:
-        """Get CORS origins based on environment"""
-        origins = []
-        
+        """Get CORS origins based on environment (computed once per Settings instance)"""
         if self.environment == "development":
-            # Development origins
-            origins = [
-                "http://localhost:3000",
-                "http://localhost:3001",
-                "http://127.0.0.1:3000",
-                "http://127.0.0.1:3001",
-            ]
+            origins = list(_DEVELOPMENT_ORIGINS)
         else:
             # Production origins from settings
-            origins = self.security.allowed_origins.copy()
+            origins = list(self.security.allowed_origins)
         
         # Add FRONTEND_URL if specified
         if self.frontend_url:
-            # Parse the URL to ensure it's properly formatted
-            frontend_origin = self.frontend_url
-            if not frontend_origin.startswith(("http://", "https://")):
-                frontend_origin = f"https://{frontend_origin}"
-            if frontend_origin not in origins:
-                origins.append(frontend_origin)
+            origins.append(_with_scheme(self.frontend_url))
         
         # Add additional frontend URLs if specified
         if self.additional_frontend_urls:
-            additional_urls = [url.strip() for url in self.additional_frontend_urls.split(',')]
-            for url in additional_urls:
-                if url:
-                    if not url.startswith(("http://", "https://")):
-                        url = f"https://{url}"
-                    if url not in origins:
-                        origins.append(url)
+            origins.extend(
+                _with_scheme(url.strip())
+                for url in self.additional_frontend_urls.split(",")
+                if url.strip()
+            )
         
         # Add specific Railway app domains if in production
         # Note: Wildcards don't work with FastAPI CORS, must use exact domains
         if self.environment == "production":
-            # Add any known Railway domains here
-            known_railway_domains = [
-                "https://cashflowagent-vip-production.up.railway.app",
-                "https://cfa-frontend-production.up.railway.app",
-                "https://client2-production.up.railway.app"
-            ]
-            for domain in known_railway_domains:
-                if domain not in origins:
-                    origins.append(domain)
+            origins.extend(_KNOWN_RAILWAY_DOMAINS)
         
-        return origins
+        # Deduplicate while preserving order
+        return list(dict.fromkeys(origins))
     
-    @property
+    @cached_property
     def logging_config(self) -> LoggingConfig:
-        """Get environment-specific logging configuration"""
+        """Get environment-specific logging configuration (built once per Settings instance)"""
         if self.environment == "production":
             return LoggingConfig(
                 level="WARNING",
@@ -277,17 +356,17 @@ class Settings(BaseSettings):
             )
         return self.logging
     
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production"""
         return self.environment == "production"
     
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development"""
         return self.environment == "development"
     
-    @property
+    @cached_property
     def is_testing(self) -> bool:
         """Check if running in test environment"""
         return self.environment == "testing"
@@ -319,32 +398,45 @@ class Settings(BaseSettings):
             
         return False
     
-    def get_external_api_config(self, service_name: str) -> Dict[str, Any]:
-        """Get configuration for external API service"""
-        configs = {
-            "polygon": {
+    @cached_property
+    def _external_api_configs(self) -> Mapping[str, Mapping[str, Any]]:
+        """Read-only per-service external API configuration, built once"""
+        return MappingProxyType({
+            "polygon": MappingProxyType({
                 "api_key": self.polygon_api_key,
                 "base_url": self.polygon_base_url,
                 "timeout": self.external_api_timeout,
                 "retry_count": self.external_api_retry_count,
-            },
-            "thetradelist": {
+            }),
+            "thetradelist": MappingProxyType({
                 "api_key": self.thetradelist_api_key,
                 "base_url": self.thetradelist_base_url,
                 "timeout": self.external_api_timeout,
                 "retry_count": self.external_api_retry_count,
                 "cache_ttl": self.market_data_cache_ttl,
-            },
+            }),
             # Add more service configurations here
-        }
-        return configs.get(service_name, {})
+        })
+    
+    def get_external_api_config(self, service_name: str) -> Mapping[str, Any]:
+        """Get configuration for external API service"""
+        return self._external_api_configs.get(service_name, _EMPTY_MAPPING)
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance"""
     return Settings()  # type: ignore[call-arg]
 
 
-# Create a global settings instance
-settings = get_settings()
+def __getattr__(name: str) -> Any:
+    """
+    Resolve the global ``settings`` instance lazily (PEP 562).
+    
+    ``from app.core.config import settings`` keeps working, but the
+    environment and .env file are only parsed on first access instead of
+    whenever this module is imported.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,18 +1,20 @@
 """
 Database configuration and session management using SQLAlchemy
 """
-from typing import AsyncGenerator, Optional
+import inspect
+from typing import AsyncGenerator, Optional, get_type_hints
 from contextlib import asynccontextmanager
+from functools import wraps
 
-from sqlalchemy import MetaData, event, Pool
+from sqlalchemy import MetaData, event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
     AsyncEngine
 )
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -43,15 +45,23 @@ engine: Optional[AsyncEngine] = None
 async_session_maker: Optional[async_sessionmaker] = None
 
 if settings.enable_database and settings.async_database_url:
+    if settings.is_testing:
+        # Small fixed pool so tests reuse connections instead of reconnecting per query
+        pool_options = {"pool_size": 2, "max_overflow": 0, "pool_pre_ping": False}
+    else:
+        pool_options = {
+            "pool_size": settings.database.pool_size,
+            "max_overflow": settings.database.max_overflow,
+            "pool_pre_ping": True,  # Enable connection health checks
+        }
+    
     engine = create_async_engine(
         settings.async_database_url,
         echo=settings.database.echo,
-        pool_size=settings.database.pool_size,
-        max_overflow=settings.database.max_overflow,
         pool_timeout=settings.database.pool_timeout,
         pool_recycle=settings.database.pool_recycle,
-        pool_pre_ping=True,  # Enable connection health checks
-        poolclass=NullPool if settings.is_testing else QueuePool,
+        poolclass=AsyncAdaptedQueuePool,
+        **pool_options,
     )
 
     # Create async session factory
@@ -64,6 +74,49 @@ if settings.enable_database and settings.async_database_url:
     )
 
 
+_WRITES_KEY = "has_writes"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session: Session, flush_context) -> None:
+    session.info[_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_writes(orm_execute_state) -> None:
+    # Bulk insert/update/delete and text() statements bypass the flush
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_writes(session: Session) -> None:
+    session.info.pop(_WRITES_KEY, None)
+
+
+def mark_writes(session: AsyncSession) -> None:
+    """
+    Flag a session as having written, for writes issued on the raw
+    connection (e.g. COPY) that the session events can't see.
+    """
+    session.info[_WRITES_KEY] = True
+
+
+def _has_work(session: AsyncSession) -> bool:
+    """
+    Whether the session needs a commit at the end of a request.
+    
+    Only sessions that flushed, executed a non-SELECT statement or still
+    hold pending objects are committed. Read-only transactions are left to
+    session.close(), which ends them with a ROLLBACK instead of a COMMIT.
+    """
+    return bool(
+        session.info.get(_WRITES_KEY)
+        or session.new or session.dirty or session.deleted
+    )
+
+
 # Database dependency for FastAPI
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -83,7 +136,8 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
+            if _has_work(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -91,30 +145,12 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-@asynccontextmanager
-async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
-    """
-    Context manager for database session.
-    
-    Usage:
-        async with get_db_context() as db:
-            user = await db.get(User, user_id)
-    """
-    if not settings.enable_database:
-        raise RuntimeError("Database is not enabled. Set ENABLE_DATABASE=true to use database features.")
-    
-    if not async_session_maker:
-        raise RuntimeError("Database is not properly configured. Check DATABASE_URL setting.")
-    
-    async with async_session_maker() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+# Context manager for database session, sharing get_db's commit/rollback logic.
+#
+# Usage:
+#     async with get_db_context() as db:
+#         user = await db.get(User, user_id)
+get_db_context = asynccontextmanager(get_db)
 
 
 class DatabaseManager:
@@ -130,6 +166,9 @@ class DatabaseManager:
         if not engine:
             raise RuntimeError("Database engine is not initialized")
             
+        # Register every model on the shared metadata before creating tables
+        import app.models  # noqa: F401
+        
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
             logger.info("Database tables created successfully")
@@ -178,26 +217,15 @@ class DatabaseManager:
             logger.info("No database connections to close")
 
 
-# Connection pool event listeners (only register if database is enabled)
-if settings.enable_database and engine:
-    @event.listens_for(Pool, "connect")
+# Connection event listeners, scoped to this engine only.
+# Liveness checks on checkout are handled by pool_pre_ping.
+if engine and settings.database_url and settings.database_url.startswith("sqlite"):
+    @event.listens_for(engine.sync_engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):
-        """Set SQLite pragmas for better performance (if using SQLite)"""
-        if settings.database_url and settings.database_url.startswith("sqlite"):
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.close()
-
-
-    @event.listens_for(Pool, "checkout")
-    def ping_connection(dbapi_connection, connection_record, connection_proxy):
-        """Ping database connection to check if it's still valid"""
+        """Set SQLite pragmas for better performance"""
         cursor = dbapi_connection.cursor()
-        try:
-            cursor.execute("SELECT 1")
-        except:
-            # Connection is broken, let's reconnect
-            raise
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 
 
 # Transaction decorator
@@ -216,19 +244,35 @@ def transactional(func):
             
             return user
     """
+    # Locate the session parameter once, at decoration time. get_type_hints
+    # resolves string annotations (from __future__ import annotations); if
+    # they can't be resolved yet, the wrapper falls back to scanning args.
+    try:
+        hints = get_type_hints(func)
+    except Exception:
+        hints = {}
+    db_index = next(
+        (
+            i for i, name in enumerate(inspect.signature(func).parameters)
+            if hints.get(name) is AsyncSession or name == "db"
+        ),
+        None
+    )
+    
+    @wraps(func)
     async def wrapper(*args, **kwargs):
         if not settings.enable_database:
             raise RuntimeError("Database is not enabled. Cannot use @transactional decorator.")
             
-        # Find the session in args or kwargs
-        session = None
-        for arg in args:
-            if isinstance(arg, AsyncSession):
-                session = arg
-                break
-        
-        if not session and 'db' in kwargs:
-            session = kwargs['db']
+        # Find the session in kwargs or at its known position in args
+        session = kwargs.get('db')
+        if session is None:
+            if db_index is not None:
+                candidate = args[db_index] if db_index < len(args) else None
+                if isinstance(candidate, AsyncSession):
+                    session = candidate
+            else:
+                session = next((arg for arg in args if isinstance(arg, AsyncSession)), None)
         
         if not session:
             # If no session provided, create one
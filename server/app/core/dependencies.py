@@ -1,12 +1,14 @@
 """
 Common dependencies for FastAPI endpoints
 """
+import inspect
+from functools import wraps
 from typing import AsyncGenerator, Optional
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.database import get_db as _get_db
+from app.core.database import get_db as _get_db, get_db_context, async_session_maker
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -26,6 +28,23 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         raise
 
 
+def _disabled_endpoint(func, detail: str):
+    """
+    Build a 503 stand-in for an endpoint whose backing service is disabled.
+    
+    Keeps the original name and signature so FastAPI builds the same
+    OpenAPI schema and dependency graph as for the real endpoint.
+    """
+    @wraps(func)
+    async def disabled_endpoint(*args, **kwargs):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail
+        )
+    disabled_endpoint.__signature__ = inspect.signature(func)
+    return disabled_endpoint
+
+
 def require_database(func):
     """
     Decorator to ensure endpoint requires database access.
@@ -38,12 +57,9 @@ def require_database(func):
             ...
     """
     if not settings.enable_database:
-        async def disabled_endpoint(*args, **kwargs):
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="This endpoint requires database access, but the database is not enabled."
-            )
-        return disabled_endpoint
+        return _disabled_endpoint(
+            func, "This endpoint requires database access, but the database is not enabled."
+        )
     return func
 
 
@@ -59,12 +75,9 @@ def require_cache(func):
             ...
     """
     if not settings.enable_caching:
-        async def disabled_endpoint(*args, **kwargs):
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="This endpoint requires cache access, but caching is not enabled."
-            )
-        return disabled_endpoint
+        return _disabled_endpoint(
+            func, "This endpoint requires cache access, but caching is not enabled."
+        )
     return func
 
 
@@ -82,16 +95,15 @@ class OptionalDatabase:
                 # Fallback logic
     """
     
-    async def __call__(self) -> Optional[AsyncSession]:
-        if not settings.enable_database:
-            return None
+    async def __call__(self) -> AsyncGenerator[Optional[AsyncSession], None]:
+        # Yield (rather than return) the session so FastAPI runs get_db's
+        # commit/rollback/close teardown once the request finishes
+        if not settings.enable_database or async_session_maker is None:
+            yield None
+            return
         
-        try:
-            async for session in _get_db():
-                return session
-        except RuntimeError:
-            return None
-        return None
+        async with get_db_context() as session:
+            yield session
 
 
 # Alias for backward compatibility
@@ -1,14 +1,20 @@
+import atexit
 import logging
 from logging import Formatter, LogRecord
+import os
+import queue
+import secrets
 import sys
-import json
-import traceback
-from datetime import datetime
-from typing import Dict, Any, Optional
+import threading
+import time
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
 from contextvars import ContextVar
-from logging.handlers import RotatingFileHandler
-import uuid
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+import orjson
 
 from .config import settings
 
@@ -18,6 +24,25 @@ request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=Non
 user_id_var: ContextVar[Optional[str]] = ContextVar("user_id", default=None)
 correlation_id_var: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
 
+# Naive datetimes are UTC throughout the app; anything orjson can't encode
+# natively falls back to str() via the default hook
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+# Standard LogRecord attributes that are not copied into structured output
+_RESERVED_LOGRECORD_ATTRS = frozenset({
+    "name", "msg", "args", "created", "filename",
+    "funcName", "levelname", "levelno", "lineno",
+    "module", "msecs", "pathname", "process",
+    "processName", "relativeCreated", "thread",
+    "threadName", "exc_info", "exc_text", "stack_info",
+    "extra_fields",
+})
+
+
+
+# Shared stand-in for records logged without extra_fields (e.g. by libraries)
+_NO_EXTRA_FIELDS: Mapping[str, Any] = MappingProxyType({})
+
 
 class StructuredFormatter(Formatter):
     """Custom formatter that outputs structured JSON logs"""
@@ -30,7 +55,7 @@ class StructuredFormatter(Formatter):
         
         # Build the log entry
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -48,144 +73,270 @@ class StructuredFormatter(Formatter):
             log_entry["correlation_id"] = correlation_id
             
         # Add extra fields
-        if hasattr(record, "extra_fields"):
-            log_entry.update(record.extra_fields)
+        log_entry.update(getattr(record, "extra_fields", _NO_EXTRA_FIELDS))
             
         # Add exception info if present
         if record.exc_info and record.exc_info[0]:
+            # exc_text is cached on the record and shared across formatters
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             log_entry["exception"] = {
                 "type": record.exc_info[0].__name__,
                 "message": str(record.exc_info[1]),
-                "traceback": traceback.format_exception(*record.exc_info)
+                "traceback": record.exc_text
             }
             
-        # Add custom attributes
-        for key, value in record.__dict__.items():
-            if key not in ["name", "msg", "args", "created", "filename", 
-                          "funcName", "levelname", "levelno", "lineno", 
-                          "module", "msecs", "pathname", "process", 
-                          "processName", "relativeCreated", "thread", 
-                          "threadName", "exc_info", "exc_text", "stack_info",
-                          "extra_fields"]:
-                log_entry[key] = value
+        # Add custom attributes; usually there are none beyond extra_fields
+        attrs = record.__dict__
+        custom_keys = attrs.keys() - _RESERVED_LOGRECORD_ATTRS
+        if custom_keys:
+            for key in custom_keys:
+                log_entry[key] = attrs[key]
                 
-        return json.dumps(log_entry)
+        return orjson.dumps(log_entry, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
 
 
 class TextFormatter(Formatter):
     """Human-readable formatter for development"""
     
     def format(self, record: LogRecord) -> str:
-        # Get context variables
-        request_id = request_id_var.get()
-        
         # Build context string
-        context_parts = []
-        if request_id:
-            context_parts.append(f"req_id={request_id[:8]}")
-            
-        context_str = f"[{' '.join(context_parts)}] " if context_parts else ""
-        
-        # Format the message
-        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
-        level = f"{record.levelname:8}"
-        location = f"{record.name}:{record.funcName}:{record.lineno}"
+        request_id = request_id_var.get()
+        context_str = "[req_id=%s] " % request_id[:8] if request_id else ""
         
-        message = f"{timestamp} | {level} | {location} | {context_str}{record.getMessage()}"
+        # Format the message in a single pass
+        message = "%04d-%02d-%02d %02d:%02d:%02d | %-8s | %s:%s:%d | %s%s" % (
+            *time.localtime(record.created)[:6],
+            record.levelname,
+            record.name,
+            record.funcName,
+            record.lineno,
+            context_str,
+            record.getMessage(),
+        )
         
         # Add exception info if present
         if record.exc_info:
-            message += f"\n{''.join(traceback.format_exception(*record.exc_info))}"
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            message += f"\n{record.exc_text}"
             
         return message
 
 
-class AppLogger:
+# Write buffer for the log file; sized to hold a full flush interval's
+# worth of records under load
+_LOG_FILE_BUFFER_SIZE = 64 * 1024
+
+
+class _BatchedRotatingFileHandler(RotatingFileHandler):
     """
-    Centralized logging system with:
-    - Structured logging (JSON format for production)
-    - Context injection (request ID, user ID, etc.)
-    - Multiple handlers (console, file, external services)
-    - Log levels per environment
-    - Performance metrics logging
-    - Error tracking integration
+    RotatingFileHandler that batches writes in the file buffer.
+    
+    The stock handler flushes after every record (one write syscall per
+    line). Here records are flushed immediately only at ERROR and above;
+    everything else is flushed by a background thread every
+    ``flush_interval`` seconds, or when the file buffer fills up.
+    Rollover is decided from a size counter kept in Python (characters,
+    as the stock handler counts them) rather than seek()/tell(), which
+    would flush the buffer on every record.
     """
     
-    def __init__(self, name: str):
-        self.logger = logging.getLogger(name)
-        self._setup_logger()
-        
-    def _setup_logger(self):
-        """Setup logger with handlers and formatters"""
-        # Clear existing handlers
-        self.logger.handlers = []
-        self.logger.setLevel(getattr(logging, settings.logging_config.level))
+    def __init__(self, *args: Any, flush_interval: float = 0.05, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._flush_interval = flush_interval
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-file-flush", daemon=True
+        )
+        self._flusher.start()
+    
+    def _open(self):
+        # A larger buffer lets one flush cover a whole batch in a single write()
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=_LOG_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        # Track the file size here instead of seek()/tell() per record,
+        # which would flush the buffer on every emit
+        self._file_size = os.fstat(stream.fileno()).st_size
+        self._rotatable = os.path.isfile(self.baseFilename)
+        return stream
+    
+    def _flush_periodically(self):
+        while not self._stop_flusher.wait(self._flush_interval):
+            self.flush()
+    
+    def emit(self, record: LogRecord):
+        try:
+            message = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if (
+                self.maxBytes > 0
+                and self._rotatable
+                and self._file_size
+                and self._file_size + len(message) >= self.maxBytes
+            ):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(message)
+            self._file_size += len(message)
+            # Never hold back errors, so crash logs reach disk
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self._stop_flusher.set()
+        super().close()
+
+
+# Records are formatted on the calling thread (so request context variables
+# are still visible) and handed to a background listener that owns the
+# console/file handlers, keeping blocking writes and rotation off the
+# request path. The queue handler and listener are shared by every AppLogger.
+_log_queue: "queue.SimpleQueue[LogRecord]" = queue.SimpleQueue()
+_queue_handler: Optional[QueueHandler] = None
+_queue_listener: Optional[QueueListener] = None
+_queue_setup_lock = threading.Lock()
+
+
+def _get_queue_handler() -> QueueHandler:
+    """Get the shared queue handler, starting the background listener on first use"""
+    global _queue_handler, _queue_listener
+    
+    with _queue_setup_lock:
+        if _queue_handler is not None:
+            return _queue_handler
         
         # Setup formatters
         if settings.logging_config.format == "json":
-            formatter = StructuredFormatter()
+            formatter: Formatter = StructuredFormatter()
         else:
             formatter = TextFormatter()
-            
+        
+        # Output handlers receive already-formatted messages
+        passthrough = Formatter("%(message)s")
+        handlers = []
+        
         # Console handler
         if "console" in settings.logging_config.handlers:
             console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+            console_handler.setFormatter(passthrough)
+            handlers.append(console_handler)
             
         # File handler
         if "file" in settings.logging_config.handlers:
             log_dir = Path(settings.logging_config.file_path).parent
             log_dir.mkdir(parents=True, exist_ok=True)
             
-            file_handler = RotatingFileHandler(
+            file_handler = _BatchedRotatingFileHandler(
                 settings.logging_config.file_path,
                 maxBytes=settings.logging_config.max_file_size,
                 backupCount=settings.logging_config.backup_count
             )
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            file_handler.setFormatter(passthrough)
+            handlers.append(file_handler)
+        
+        _queue_listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+        
+        _queue_handler = QueueHandler(_log_queue)
+        _queue_handler.setFormatter(formatter)
+        return _queue_handler
+
+
+def _without_context(extra: Dict[str, Any]) -> Dict[str, Any]:
+    """_add_context stand-in used when context injection is disabled"""
+    return extra
+
+
+class AppLogger:
+    """
+    Centralized logging system with:
+    - Structured logging (JSON format for production)
+    - Context injection (request ID, user ID, etc.)
+    - Multiple handlers (console, file, external services)
+    - Log levels per environment
+    - Performance metrics logging
+    - Error tracking integration
+    """
+    
+    def __init__(self, name: str):
+        self.logger = logging.getLogger(name)
+        self._setup_logger()
+        if not settings.logging_config.include_context:
+            # Context injection is off; skip the ContextVar reads entirely
+            self._add_context = _without_context
+        
+    def _setup_logger(self):
+        """Setup logger with the shared queue handler"""
+        # Clear existing handlers
+        self.logger.handlers = []
+        self.logger.setLevel(getattr(logging, settings.logging_config.level))
+        self.logger.addHandler(_get_queue_handler())
             
         # Prevent propagation to root logger
         self.logger.propagate = False
         
     def _add_context(self, extra: Dict[str, Any]) -> Dict[str, Any]:
-        """Add context variables to extra fields"""
-        if settings.logging_config.include_context:
-            extra["request_id"] = request_id_var.get()
-            extra["user_id"] = user_id_var.get()
-            extra["correlation_id"] = correlation_id_var.get()
+        """Add context variables that are set to extra fields"""
+        request_id = request_id_var.get()
+        if request_id:
+            extra["request_id"] = request_id
+        user_id = user_id_var.get()
+        if user_id:
+            extra["user_id"] = user_id
+        correlation_id = correlation_id_var.get()
+        if correlation_id:
+            extra["correlation_id"] = correlation_id
         return extra
         
-    def debug(self, message: str, **kwargs):
-        """Log debug message"""
+    def debug(self, message: str, *args, **kwargs):
+        """Log debug message; %-style args are interpolated only if emitted"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        # Records without fields fall back to _NO_EXTRA_FIELDS in the formatter
         extra = self._add_context(kwargs)
-        self.logger.debug(message, extra={"extra_fields": extra})
+        self.logger.debug(message, *args, extra={"extra_fields": extra} if extra else None)
         
-    def info(self, message: str, **kwargs):
-        """Log info message"""
+    def info(self, message: str, *args, **kwargs):
+        """Log info message; %-style args are interpolated only if emitted"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         extra = self._add_context(kwargs)
-        self.logger.info(message, extra={"extra_fields": extra})
+        self.logger.info(message, *args, extra={"extra_fields": extra} if extra else None)
         
-    def warning(self, message: str, **kwargs):
-        """Log warning message"""
+    def warning(self, message: str, *args, **kwargs):
+        """Log warning message; %-style args are interpolated only if emitted"""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         extra = self._add_context(kwargs)
-        self.logger.warning(message, extra={"extra_fields": extra})
+        self.logger.warning(message, *args, extra={"extra_fields": extra} if extra else None)
         
-    def error(self, message: str, error: Optional[Exception] = None, **kwargs):
+    def error(self, message: str, *args, error: Optional[Exception] = None, **kwargs):
         """Log error message"""
         extra = self._add_context(kwargs)
         if error:
             extra["error_type"] = type(error).__name__
             extra["error_message"] = str(error)
-            self.logger.error(message, exc_info=True, extra={"extra_fields": extra})
+            self.logger.error(message, *args, exc_info=True, extra={"extra_fields": extra})
         else:
-            self.logger.error(message, extra={"extra_fields": extra})
+            self.logger.error(message, *args, extra={"extra_fields": extra} if extra else None)
             
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """Log critical message"""
         extra = self._add_context(kwargs)
-        self.logger.critical(message, extra={"extra_fields": extra})
+        self.logger.critical(message, *args, extra={"extra_fields": extra} if extra else None)
         
     def log_api_request(
         self, 
@@ -197,7 +348,9 @@ class AppLogger:
     ):
         """Log API requests with metadata"""
         self.info(
-            f"API Request: {method} {endpoint}",
+            "API Request: %s %s",
+            method,
+            endpoint,
             endpoint=endpoint,
             method=method,
             client_ip=client_ip,
@@ -213,9 +366,10 @@ class AppLogger:
         **kwargs
     ):
         """Log API responses with performance metrics"""
-        level = "info" if 200 <= status_code < 400 else "warning"
-        getattr(self, level)(
-            f"API Response: {status_code}",
+        log = self.info if 200 <= status_code < 400 else self.warning
+        log(
+            "API Response: %s",
+            status_code,
             status_code=status_code,
             response_time_ms=round(response_time * 1000, 2),
             endpoint=endpoint,
@@ -231,7 +385,8 @@ class AppLogger:
     ):
         """Log external API interactions"""
         self.info(
-            f"External API Call: {service}",
+            "External API Call: %s",
+            service,
             service=service,
             endpoint=endpoint,
             method=method,
@@ -246,9 +401,11 @@ class AppLogger:
         **kwargs
     ):
         """Log external API response"""
-        level = "info" if 200 <= status_code < 400 else "warning"
-        getattr(self, level)(
-            f"External API Response: {service} - {status_code}",
+        log = self.info if 200 <= status_code < 400 else self.warning
+        log(
+            "External API Response: %s - %s",
+            service,
+            status_code,
             service=service,
             status_code=status_code,
             response_time_ms=round(response_time * 1000, 2),
@@ -257,6 +414,8 @@ class AppLogger:
         
     def log_cache_hit(self, key: str, **kwargs):
         """Log cache hit"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.debug(
             "Cache hit",
             cache_key=key,
@@ -266,6 +425,8 @@ class AppLogger:
         
     def log_cache_miss(self, key: str, **kwargs):
         """Log cache miss"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.debug(
             "Cache miss",
             cache_key=key,
@@ -276,7 +437,8 @@ class AppLogger:
     def log_business_event(self, event_type: str, data: Dict[str, Any]):
         """Log business-specific events"""
         self.info(
-            f"Business Event: {event_type}",
+            "Business Event: %s",
+            event_type,
             event_type=event_type,
             event_data=data
         )
@@ -290,7 +452,8 @@ class AppLogger:
     ):
         """Log performance metrics"""
         self.info(
-            f"Performance: {operation}",
+            "Performance: %s",
+            operation,
             operation=operation,
             duration_ms=round(duration * 1000, 2),
             success=success,
@@ -304,15 +467,18 @@ class AppLogger:
         details: Dict[str, Any]
     ):
         """Log security-related events"""
-        level = {
-            "low": "info",
-            "medium": "warning",
-            "high": "error",
-            "critical": "critical"
-        }.get(severity, "warning")
-        
-        getattr(self, level)(
-            f"Security Event: {event_type}",
+        if severity == "low":
+            log = self.info
+        elif severity == "high":
+            log = self.error
+        elif severity == "critical":
+            log = self.critical
+        else:
+            log = self.warning
+            
+        log(
+            "Security Event: %s",
+            event_type,
             security_event=event_type,
             severity=severity,
             details=details
@@ -339,8 +505,8 @@ def set_correlation_id(correlation_id: str):
     correlation_id_var.set(correlation_id)
     
 def generate_request_id() -> str:
-    """Generate a new request ID"""
-    return str(uuid.uuid4())
+    """Generate a new request ID (16 hex chars, 64 random bits)"""
+    return secrets.token_hex(8)
     
 def clear_context():
     """Clear all context variables"""
@@ -6,8 +6,10 @@ from sentry_sdk.integrations.httpx import HttpxIntegration  # type: ignore[impor
 from sentry_sdk.integrations.logging import LoggingIntegration  # type: ignore[import-not-found]
 from typing import Dict, Any, Optional, List
 from enum import Enum
+import reprlib
 import time
 from functools import wraps
+from urllib.parse import parse_qsl, urlencode
 import asyncio
 import logging
 
@@ -17,6 +19,57 @@ from .logging import get_logger, request_id_var, user_id_var
 
 logger = get_logger(__name__)
 
+# Integrations are stateless until setup, so they are built once per process
+_SENTRY_INTEGRATIONS = (
+    FastApiIntegration(
+        transaction_style="endpoint"
+    ),
+    SqlalchemyIntegration(),
+    RedisIntegration(),
+    HttpxIntegration(),
+    LoggingIntegration(
+        level=logging.INFO,
+        event_level=logging.ERROR
+    ),
+)
+
+# Request data redacted before events are sent to Sentry
+_SENSITIVE_HEADERS = frozenset({
+    "authorization", "api-key", "x-api-key",
+    "cookie", "session", "token", "secret"
+})
+_SENSITIVE_PARAMS = frozenset({"api_key", "token", "secret", "password"})
+# Matched as substrings of extra context keys
+_SENSITIVE_EXTRA_KEYS = (
+    "password", "token", "secret", "api_key",
+    "private_key", "credit_card", "ssn"
+)
+
+# Truncating repr for captured function arguments
+_args_repr = reprlib.Repr()
+_args_repr.maxtuple = 3
+_args_repr.maxlist = 3
+_args_repr.maxstring = 200
+_args_repr.maxother = 200
+
+
+class _LazyRepr:
+    """Defers repr of captured arguments until Sentry serializes the data"""
+    
+    __slots__ = ("_value",)
+    
+    def __init__(self, value: Any):
+        self._value = value
+        
+    def __repr__(self) -> str:
+        return _args_repr.repr(self._value)
+        
+    __str__ = __repr__
+
+
+# Set once sentry_sdk.init has run, so repeated startup hooks are no-ops
+_sentry_initialized = False
+
 
 class AlertSeverity(Enum):
     """Alert severity levels"""
@@ -26,12 +79,25 @@ class AlertSeverity(Enum):
     CRITICAL = "critical"
 
 
+# Sentry event level for each alert severity
+_SENTRY_LEVEL_BY_SEVERITY = {
+    AlertSeverity.LOW: "info",
+    AlertSeverity.MEDIUM: "warning",
+    AlertSeverity.HIGH: "error",
+    AlertSeverity.CRITICAL: "fatal"
+}
+
+
 class ErrorMonitoring:
     """Centralized error monitoring with Sentry"""
     
     @staticmethod
     def init_sentry(app_settings: Optional[Any] = None):
         """Initialize Sentry SDK with custom configuration"""
+        global _sentry_initialized
+        if _sentry_initialized:
+            return
+            
         config = app_settings or settings
         
         if not config.sentry_dsn:
@@ -47,18 +113,7 @@ class ErrorMonitoring:
             sentry_sdk.init(
                 dsn=config.sentry_dsn,
                 environment=config.sentry_environment or config.environment,
-                integrations=[
-                    FastApiIntegration(
-                        transaction_style="endpoint"
-                    ),
-                    SqlalchemyIntegration(),
-                    RedisIntegration(),
-                    HttpxIntegration(),
-                    LoggingIntegration(
-                        level=logging.INFO,
-                        event_level=logging.ERROR
-                    ),
-                ],
+                integrations=list(_SENTRY_INTEGRATIONS),
                 traces_sample_rate=config.sentry_traces_sample_rate,
                 profiles_sample_rate=config.sentry_profiles_sample_rate,
                 attach_stacktrace=config.logging.sentry_attach_stacktrace,
@@ -70,6 +125,7 @@ class ErrorMonitoring:
                 max_breadcrumbs=50,
                 debug=config.debug,
             )
+            _sentry_initialized = True
             
             logger.info(
                 "Sentry initialized",
@@ -91,37 +147,30 @@ class ErrorMonitoring:
                 if exc_type.__name__ in ["KeyboardInterrupt", "SystemExit"]:
                     return None
                     
-        # Remove sensitive headers
-        if "request" in event and "headers" in event["request"]:
-            sensitive_headers = [
-                "authorization", "api-key", "x-api-key", 
-                "cookie", "session", "token", "secret"
-            ]
-            headers = event["request"]["headers"]
-            for header in sensitive_headers:
-                if header in headers:
-                    headers[header] = "[REDACTED]"
-                    
-        # Remove sensitive query parameters
-        if "request" in event and "query_string" in event["request"]:
-            query_string = event["request"]["query_string"]
-            sensitive_params = ["api_key", "token", "secret", "password"]
-            for param in sensitive_params:
-                if param in query_string:
-                    # Simple redaction - in production use proper query parsing
-                    query_string = query_string.replace(
-                        f"{param}=", f"{param}=[REDACTED]"
-                    )
-            event["request"]["query_string"] = query_string
+        request = event.get("request")
+        if request:
+            # Remove sensitive headers (header names are case-insensitive)
+            headers = request.get("headers")
+            if headers:
+                for header in list(headers):
+                    if header.lower() in _SENSITIVE_HEADERS:
+                        headers[header] = "[REDACTED]"
+                        
+            # Remove sensitive query parameters
+            query_string = request.get("query_string")
+            if query_string and isinstance(query_string, str):
+                params = parse_qsl(query_string, keep_blank_values=True)
+                if any(name.lower() in _SENSITIVE_PARAMS for name, _ in params):
+                    request["query_string"] = urlencode([
+                        (name, "[REDACTED]" if name.lower() in _SENSITIVE_PARAMS else value)
+                        for name, value in params
+                    ], safe="[]")
             
         # Remove sensitive data from extra context
         if "extra" in event:
-            sensitive_keys = [
-                "password", "token", "secret", "api_key", 
-                "private_key", "credit_card", "ssn"
-            ]
             for key in list(event["extra"].keys()):
-                if any(sensitive in key.lower() for sensitive in sensitive_keys):
+                lowered = key.lower()
+                if any(sensitive in lowered for sensitive in _SENSITIVE_EXTRA_KEYS):
                     event["extra"][key] = "[REDACTED]"
                     
         # Add request context
@@ -153,6 +202,9 @@ class ErrorMonitoring:
         fingerprint: Optional[List[str]] = None
     ):
         """Capture exception with additional context"""
+        if not _sentry_initialized:
+            return
+            
         with sentry_sdk.push_scope() as scope:
             # Set level
             scope.level = level
@@ -187,6 +239,9 @@ class ErrorMonitoring:
         fingerprint: Optional[List[str]] = None
     ):
         """Capture custom messages/events"""
+        if not _sentry_initialized:
+            return
+            
         with sentry_sdk.push_scope() as scope:
             # Add context
             if context:
@@ -212,6 +267,9 @@ class ErrorMonitoring:
         data: Optional[Dict[str, Any]] = None
     ):
         """Add breadcrumb for context"""
+        if not _sentry_initialized:
+            return
+            
         sentry_sdk.add_breadcrumb(
             category=category,
             message=message,
@@ -265,12 +323,7 @@ class AlertManager:
         """Send alert through Sentry and other configured channels"""
         
         # Determine Sentry level based on severity
-        sentry_level = {
-            AlertSeverity.LOW: "info",
-            AlertSeverity.MEDIUM: "warning",
-            AlertSeverity.HIGH: "error",
-            AlertSeverity.CRITICAL: "fatal"
-        }.get(severity, "error")
+        sentry_level = _SENTRY_LEVEL_BY_SEVERITY.get(severity, "error")
         
         # Create alert context
         alert_context = {
@@ -335,6 +388,11 @@ def monitor_performance(operation_name: str, capture_args: bool = False):
             return await polygon_service.get_data(symbol)
     """
     def decorator(func):
+        # Without tracing no transaction would ever be sent, so skip the
+        # wrapper and its per-call span bookkeeping entirely
+        if not settings.sentry_dsn or not settings.sentry_traces_sample_rate:
+            return func
+            
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
             with sentry_sdk.start_transaction(op=operation_name, name=func.__name__) as transaction:
@@ -343,8 +401,8 @@ def monitor_performance(operation_name: str, capture_args: bool = False):
                 
                 # Capture arguments if requested
                 if capture_args and (args or kwargs):
-                    transaction.set_data("args", str(args[:3]))  # Limit to first 3 args
-                    transaction.set_data("kwargs", str(list(kwargs.keys())))
+                    transaction.set_data("args", _LazyRepr(args))
+                    transaction.set_data("kwargs", _LazyRepr(list(kwargs)))
                     
                 # Start main span
                 with sentry_sdk.start_span(op=f"{operation_name}.execute") as span:
@@ -367,8 +425,8 @@ def monitor_performance(operation_name: str, capture_args: bool = False):
                 transaction.set_tag("function", f"{func.__module__}.{func.__name__}")
                 
                 if capture_args and (args or kwargs):
-                    transaction.set_data("args", str(args[:3]))
-                    transaction.set_data("kwargs", str(list(kwargs.keys())))
+                    transaction.set_data("args", _LazyRepr(args))
+                    transaction.set_data("kwargs", _LazyRepr(list(kwargs)))
                     
                 with sentry_sdk.start_span(op=f"{operation_name}.execute") as span:
                     start_time = time.time()
@@ -416,8 +474,8 @@ def capture_errors(
                     e,
                     context={
                         "function": f"{func.__module__}.{func.__name__}",
-                        "args": str(args[:3]) if args else None,
-                        "kwargs": str(list(kwargs.keys())) if kwargs else None
+                        "args": _args_repr.repr(args) if args else None,
+                        "kwargs": _args_repr.repr(list(kwargs)) if kwargs else None
                     },
                     level=level,
                     fingerprint=fingerprint
@@ -434,8 +492,8 @@ def capture_errors(
                     e,
                     context={
                         "function": f"{func.__module__}.{func.__name__}",
-                        "args": str(args[:3]) if args else None,
-                        "kwargs": str(list(kwargs.keys())) if kwargs else None
+                        "args": _args_repr.repr(args) if args else None,
+                        "kwargs": _args_repr.repr(list(kwargs)) if kwargs else None
                     },
                     level=level,
                     fingerprint=fingerprint
@@ -1,12 +1,15 @@
 """
 One Click Trading (OCT) JWT authentication
 """
-from jose import jwt
+import jwt
+from cryptography.hazmat.primitives import serialization
 from typing import Optional, Dict, Any
-from datetime import datetime
 import logging
+import time
 from fastapi import Query, Header, Cookie, HTTPException, status, Depends
 
+from app.core.token_cache import VerifiedTokenCache
+
 logger = logging.getLogger(__name__)
 
 # OCT Public Key for JWT verification
@@ -20,14 +23,23 @@ crCucCyTMeYqwyGl14zN0rArFi6eFXDn+JWTs3Qf04F8LQn7TiwxKV9KRgPHYFtG
 qwIDAQAB
 -----END PUBLIC KEY-----"""
 
+# Parsed once at import instead of on every jwt.decode call
+_OCT_VERIFICATION_KEY = serialization.load_pem_public_key(OCT_PUBLIC_KEY.encode())
+
+# Verified payloads, so repeat requests with the same token skip RSA verification
+_verified_tokens = VerifiedTokenCache()
+
 
 class OCTTokenPayload:
     """OCT JWT token payload structure"""
+    __slots__ = ("sub", "subscriptions", "exp", "iat", "_raw")
+    
     def __init__(self, data: Dict[str, Any]):
-        self.sub: str = data.get("sub", "")  # User ID
-        self.subscriptions: Any = data.get("subscriptions")
-        self.exp: Optional[int] = data.get("exp")
-        self.iat: Optional[int] = data.get("iat")
+        get = data.get
+        self.sub: str = get("sub", "")  # User ID
+        self.subscriptions: Any = get("subscriptions")
+        self.exp: Optional[int] = get("exp")
+        self.iat: Optional[int] = get("iat")
         self._raw = data
     
     @property
@@ -39,7 +51,7 @@ class OCTTokenPayload:
     def is_expired(self) -> bool:
         """Check if token is expired"""
         if self.exp:
-            return datetime.utcnow().timestamp() > self.exp
+            return time.time() > self.exp
         return False
     
     def to_dict(self) -> Dict[str, Any]:
@@ -47,6 +59,22 @@ class OCTTokenPayload:
         return self._raw
 
 
+def _expired_before_verification(token: str) -> bool:
+    """
+    Check the exp claim without verifying the signature
+    
+    The payload is readable without the key, so expired tokens can be
+    rejected before paying for RSA verification. Malformed tokens return
+    False and are reported by the full verification instead.
+    """
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return False
+    exp = claims.get("exp")
+    return isinstance(exp, (int, float)) and exp <= time.time()
+
+
 def verify_token_string(token: str) -> Optional[OCTTokenPayload]:
     """
     Verify JWT token string from One Click Trading
@@ -57,36 +85,40 @@ def verify_token_string(token: str) -> Optional[OCTTokenPayload]:
     Returns:
         OCTTokenPayload if valid, None if invalid
     """
+    cached = _verified_tokens.get(token)
+    if cached is not None:
+        return cached
+    
+    if _expired_before_verification(token):
+        logger.warning("OCT token has expired signature")
+        return None
+    
     try:
         logger.debug("Attempting to verify OCT JWT token")
         
         # Decode and verify the token
         decoded = jwt.decode(
             token, 
-            OCT_PUBLIC_KEY, 
+            _OCT_VERIFICATION_KEY, 
             algorithms=["RS256"],
             options={"verify_signature": True}
         )
         
-        # Create payload object
+        # Create payload object; jwt.decode has already rejected expired tokens
         payload = OCTTokenPayload(decoded)
         
-        # Check if expired
-        if payload.is_expired:
-            logger.warning(f"OCT token expired for user {payload.user_id}")
-            return None
-        
-        logger.info(f"OCT token verified successfully for user {payload.user_id}")
+        logger.debug("OCT token verified successfully for user %s", payload.user_id)
+        _verified_tokens.set(token, payload, payload.exp)
         return payload
         
     except jwt.ExpiredSignatureError:
         logger.warning("OCT token has expired signature")
         return None
-    except jwt.JWTError as e:
-        logger.warning(f"Invalid OCT token: {str(e)}")
+    except jwt.InvalidTokenError as e:
+        logger.warning("Invalid OCT token: %s", e)
         return None
     except Exception as e:
-        logger.error(f"Unexpected error verifying OCT token: {str(e)}")
+        logger.error("Unexpected error verifying OCT token: %s", e)
         return None
 
 
@@ -107,23 +139,23 @@ def extract_token_from_request(
         Token string if found, None otherwise
     """
     # Check query parameter first (most common for OCT)
-    if query_params and "token" in query_params:
-        logger.debug("Token found in query parameters")
-        return query_params["token"]
+    if query_params:
+        token = query_params.get("token")
+        if token:
+            return token
     
     # Check Authorization header
     if headers:
-        auth_header = headers.get("authorization", "")
-        if auth_header.startswith("Bearer "):
-            logger.debug("Token found in Authorization header")
+        auth_header = headers.get("authorization")
+        if auth_header and auth_header[:7] == "Bearer ":
             return auth_header[7:]
     
     # Check cookies
-    if cookies and "auth_token" in cookies:
-        logger.debug("Token found in cookies")
-        return cookies["auth_token"]
+    if cookies:
+        token = cookies.get("auth_token")
+        if token:
+            return token
     
-    logger.debug("No token found in request")
     return None
 
 
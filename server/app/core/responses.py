@@ -1,8 +1,11 @@
 from typing import TypeVar, Generic, Optional, Any, Dict, List, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict
+from decimal import Decimal
+from enum import Enum
+from pydantic import BaseModel, Field
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 
 from .logging import get_logger, request_id_var
 
@@ -12,6 +15,28 @@ logger = get_logger(__name__)
 T = TypeVar('T')
 
 
+def _encode_default(obj: Any) -> Any:
+    """Encode values orjson doesn't serialize natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class APIJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also encodes Decimals and pydantic models"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_encode_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
 class BaseResponse(BaseModel, Generic[T]):
     """Base response model for all API responses"""
     success: bool = Field(..., description="Whether the request was successful")
@@ -20,13 +45,8 @@ class BaseResponse(BaseModel, Generic[T]):
     error: Optional[Dict[str, Any]] = Field(None, description="Error details if request failed")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
     request_id: Optional[str] = Field(None, description="Unique request identifier")
+    # Serialized natively (ISO 8601) by pydantic's core; no Python-level encoder
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
-    
-    model_config = ConfigDict(
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-    )
 
 
 class SuccessResponse(BaseResponse[T]):
@@ -67,7 +87,7 @@ class PaginatedResponse(SuccessResponse[List[T]]):
         message: str = "Success"
     ) -> "PaginatedResponse[T]":
         """Create a paginated response"""
-        total_pages = (total + page_size - 1) // page_size
+        total_pages = -(-total // page_size)  # ceiling division
         
         return cls(
             data=items,
@@ -92,7 +112,7 @@ def create_success_response(
     status_code: int = status.HTTP_200_OK,
     metadata: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, str]] = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create standardized success response
     
@@ -104,31 +124,24 @@ def create_success_response(
         headers: Additional response headers
         
     Returns:
-        JSONResponse with standardized format
+        ORJSONResponse with standardized format
     """
-    response: SuccessResponse = SuccessResponse(
-        data=data,
-        message=message,
-        metadata=metadata,
-        request_id=request_id_var.get()
-    )
-    
     logger.debug(f"Success response: {message}", status_code=status_code)
     
-    # Build response content for success response
-    content = {
-        "success": response.success,
-        "message": response.message,
-        "data": response.data,
-        "metadata": response.metadata,
-        "request_id": response.request_id,
-        "timestamp": response.timestamp.isoformat() if response.timestamp else None
-    }
-    
-    # Remove None values
-    content = {k: v for k, v in content.items() if v is not None}
+    # Build the SuccessResponse shape directly; validating a model per
+    # response only to read it back into a dict is pure overhead
+    # None values are left out rather than stripped afterwards
+    content: Dict[str, Any] = {"success": True, "message": message}
+    if data is not None:
+        content["data"] = data
+    if metadata is not None:
+        content["metadata"] = metadata
+    request_id = request_id_var.get()
+    if request_id is not None:
+        content["request_id"] = request_id
+    content["timestamp"] = datetime.utcnow()
     
-    return JSONResponse(
+    return APIJSONResponse(
         status_code=status_code,
         content=content,
         headers=headers
@@ -141,7 +154,7 @@ def create_error_response(
     status_code: int = status.HTTP_400_BAD_REQUEST,
     error_details: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, str]] = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create standardized error response
     
@@ -153,17 +166,8 @@ def create_error_response(
         headers: Additional response headers
         
     Returns:
-        JSONResponse with standardized error format
+        ORJSONResponse with standardized error format
     """
-    response = ErrorResponse(
-        error_code=error_code,
-        message=message,
-        error_details=error_details,
-        error=None,
-        metadata=None,
-        request_id=request_id_var.get()
-    )
-    
     logger.warning(
         f"Error response: {message}",
         error_code=error_code,
@@ -171,19 +175,21 @@ def create_error_response(
         error_details=error_details
     )
     
-    # Build response content manually to avoid serialization issues
-    content = {
-        "success": response.success,
-        "message": response.message,
-        "error": response.build_error(),  # Call the method to build error object
-        "request_id": response.request_id,
-        "timestamp": response.timestamp.isoformat() if response.timestamp else None
+    # Build the ErrorResponse shape directly
+    error: Dict[str, Any] = {
+        "code": error_code,
+        "message": message,
     }
+    if error_details:
+        error["details"] = error_details
+        
+    content: Dict[str, Any] = {"success": False, "message": message, "error": error}
+    request_id = request_id_var.get()
+    if request_id is not None:
+        content["request_id"] = request_id
+    content["timestamp"] = datetime.utcnow()
     
-    # Remove None values
-    content = {k: v for k, v in content.items() if v is not None}
-    
-    return JSONResponse(
+    return APIJSONResponse(
         status_code=status_code,
         content=content,
         headers=headers
@@ -197,7 +203,7 @@ def create_paginated_response(
     page_size: int,
     message: str = "Success",
     metadata: Optional[Dict[str, Any]] = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create standardized paginated response
     
@@ -210,19 +216,8 @@ def create_paginated_response(
         metadata: Additional metadata
         
     Returns:
-        JSONResponse with pagination metadata
+        ORJSONResponse with pagination metadata
     """
-    response = PaginatedResponse.create(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        message=message
-    )
-    
-    if metadata:
-        response.metadata = metadata
-        
     logger.debug(
         f"Paginated response: {message}",
         total=total,
@@ -230,28 +225,36 @@ def create_paginated_response(
         page_size=page_size
     )
     
-    # Build response content for paginated response
-    content = {
-        "success": response.success,
-        "message": response.message,
-        "data": response.data,
-        "pagination": response.pagination,
-        "metadata": response.metadata,
-        "request_id": response.request_id,
-        "timestamp": response.timestamp.isoformat() if response.timestamp else None
+    # Build the PaginatedResponse shape directly
+    total_pages = -(-total // page_size)  # ceiling division
+    content: Dict[str, Any] = {
+        "success": True,
+        "message": message,
+        "data": items,
+        "pagination": {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+            "has_next": page < total_pages,
+            "has_prev": page > 1
+        }
     }
+    if metadata:
+        content["metadata"] = metadata
+    request_id = request_id_var.get()
+    if request_id is not None:
+        content["request_id"] = request_id
+    content["timestamp"] = datetime.utcnow()
     
-    # Remove None values
-    content = {k: v for k, v in content.items() if v is not None}
-    
-    return JSONResponse(
+    return APIJSONResponse(
         status_code=status.HTTP_200_OK,
         content=content
     )
 
 
 # Common error responses
-class ErrorCode:
+class ErrorCode(str, Enum):
     """Common error codes"""
     # Client errors (4xx)
     VALIDATION_ERROR = "VALIDATION_ERROR"
@@ -275,11 +278,59 @@ class ErrorCode:
     QUOTA_EXCEEDED = "QUOTA_EXCEEDED"
 
 
+def _static_error_body(error_code: str, message: str) -> bytes:
+    """Pre-encode an error body that never varies between requests"""
+    return orjson.dumps({
+        "success": False,
+        "message": message,
+        "error": {"code": error_code, "message": message},
+    })
+
+
+# Bodies for the high-volume default error responses, encoded once at import.
+# They omit request_id and timestamp; the request ID is still returned in the
+# X-Request-ID header. A fresh Response is built per call because middleware
+# adds headers to it.
+_AUTHENTICATION_ERROR_MESSAGE = "Authentication required"
+_AUTHENTICATION_ERROR_BODY = _static_error_body(
+    ErrorCode.AUTHENTICATION_REQUIRED, _AUTHENTICATION_ERROR_MESSAGE
+)
+_PERMISSION_ERROR_MESSAGE = "Permission denied"
+_PERMISSION_ERROR_BODY = _static_error_body(
+    ErrorCode.PERMISSION_DENIED, _PERMISSION_ERROR_MESSAGE
+)
+_RATE_LIMIT_ERROR_MESSAGE = "Rate limit exceeded"
+_RATE_LIMIT_ERROR_BODY = _static_error_body(
+    ErrorCode.RATE_LIMIT_EXCEEDED, _RATE_LIMIT_ERROR_MESSAGE
+)
+
+
+def _static_error_response(
+    body: bytes,
+    error_code: str,
+    message: str,
+    status_code: int,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Create an error response from a pre-encoded body"""
+    logger.warning(
+        f"Error response: {message}",
+        error_code=error_code,
+        status_code=status_code
+    )
+    return Response(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json"
+    )
+
+
 # Predefined error responses
 def validation_error(
     message: str = "Validation failed",
     errors: Optional[List[Dict[str, Any]]] = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create validation error response"""
     return create_error_response(
         error_code=ErrorCode.VALIDATION_ERROR,
@@ -292,7 +343,7 @@ def validation_error(
 def not_found_error(
     resource: str,
     identifier: Optional[Union[str, int]] = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create not found error response"""
     message = f"{resource} not found"
     if identifier:
@@ -307,9 +358,17 @@ def not_found_error(
 
 
 def authentication_error(
-    message: str = "Authentication required"
-) -> JSONResponse:
+    message: str = _AUTHENTICATION_ERROR_MESSAGE
+) -> Response:
     """Create authentication error response"""
+    if message == _AUTHENTICATION_ERROR_MESSAGE:
+        return _static_error_response(
+            _AUTHENTICATION_ERROR_BODY,
+            ErrorCode.AUTHENTICATION_REQUIRED,
+            message,
+            status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": "Bearer"}
+        )
     return create_error_response(
         error_code=ErrorCode.AUTHENTICATION_REQUIRED,
         message=message,
@@ -319,9 +378,16 @@ def authentication_error(
 
 
 def permission_error(
-    message: str = "Permission denied"
-) -> JSONResponse:
+    message: str = _PERMISSION_ERROR_MESSAGE
+) -> Response:
     """Create permission denied error response"""
+    if message == _PERMISSION_ERROR_MESSAGE:
+        return _static_error_response(
+            _PERMISSION_ERROR_BODY,
+            ErrorCode.PERMISSION_DENIED,
+            message,
+            status.HTTP_403_FORBIDDEN
+        )
     return create_error_response(
         error_code=ErrorCode.PERMISSION_DENIED,
         message=message,
@@ -330,10 +396,18 @@ def permission_error(
 
 
 def rate_limit_error(
-    message: str = "Rate limit exceeded",
+    message: str = _RATE_LIMIT_ERROR_MESSAGE,
     retry_after: Optional[int] = None
-) -> JSONResponse:
+) -> Response:
     """Create rate limit error response"""
+    if message == _RATE_LIMIT_ERROR_MESSAGE and not retry_after:
+        return _static_error_response(
+            _RATE_LIMIT_ERROR_BODY,
+            ErrorCode.RATE_LIMIT_EXCEEDED,
+            message,
+            status.HTTP_429_TOO_MANY_REQUESTS
+        )
+        
     headers = {}
     if retry_after:
         headers["Retry-After"] = str(retry_after)
@@ -350,7 +424,7 @@ def rate_limit_error(
 def internal_error(
     message: str = "An internal error occurred",
     error: Optional[Exception] = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create internal server error response"""
     error_details = None
     if error and logger.logger.isEnabledFor(logger.logger.level):
@@ -370,7 +444,7 @@ def internal_error(
 def external_api_error(
     service: str,
     message: Optional[str] = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create external API error response"""
     default_message = f"External service '{service}' is unavailable"
     
@@ -3,31 +3,79 @@ Security utilities for JWT authentication and authorization
 """
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
-from jose import jwt, JWTError  # type: ignore[import-untyped]
-from jose.exceptions import ExpiredSignatureError, JWTClaimsError  # type: ignore[import-untyped]
-from passlib.context import CryptContext  # type: ignore[import-untyped]
+from functools import lru_cache
+import re
+import secrets
+import time
+import jwt
+from jwt.exceptions import (
+    ExpiredSignatureError,
+    ImmatureSignatureError,
+    InvalidAudienceError,
+    InvalidIssuedAtError,
+    InvalidIssuerError,
+    InvalidTokenError,
+    MissingRequiredClaimError,
+)
+from fastapi.concurrency import run_in_threadpool
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.core.token_cache import VerifiedTokenCache
 
 logger = get_logger(__name__)
 
-# Password hashing context (for local user management if needed)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=1)
+def _pwd_context() -> Any:
+    """
+    Password hashing context (for local user management if needed)
+    
+    Built on first use: passlib is slow to import and most processes
+    never hash a password.
+    """
+    from passlib.context import CryptContext  # type: ignore[import-untyped]
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+# bcrypt hash (default 12 rounds) of a throwaway value, verified against
+# for unknown users so that path costs the same as a real check
+_DUMMY_PASSWORD_HASH = "$2b$12$IkntcaV60YrGZcAWvYPnu.S4xmfIRi0jCqC359tTWp.NapnOd5xi6"
+
+# API key format: at least 32 URL-safe base64 characters
+_API_KEY_RE = re.compile(r"[A-Za-z0-9_-]{32,}")
+
+# Claim validation failures, reported separately from malformed or forged tokens
+_CLAIMS_ERRORS = (
+    ImmatureSignatureError,
+    InvalidAudienceError,
+    InvalidIssuedAtError,
+    InvalidIssuerError,
+    MissingRequiredClaimError,
+)
+
+# Verified payloads, so repeat requests with the same token skip signature checks
+_verified_tokens = VerifiedTokenCache()
 
 
 class JWTPayload:
     """JWT Payload structure from one-click trading service"""
+    __slots__ = (
+        "sub", "email", "username", "full_name", "subscriptions",
+        "exp", "iat", "scopes", "is_active", "raw_payload",
+    )
+    
     def __init__(self, payload: Dict[str, Any]):
-        self.sub: str = payload.get("sub", "")  # User ID
-        self.email: Optional[str] = payload.get("email")
-        self.username: Optional[str] = payload.get("username")
-        self.full_name: Optional[str] = payload.get("full_name")
-        self.subscriptions: Dict[str, Any] = payload.get("subscriptions", {})
-        self.exp: Optional[int] = payload.get("exp")
-        self.iat: Optional[int] = payload.get("iat")
-        self.scopes: List[str] = payload.get("scopes", [])
-        self.is_active: bool = payload.get("is_active", True)
+        get = payload.get
+        self.sub: str = get("sub", "")  # User ID
+        self.email: Optional[str] = get("email")
+        self.username: Optional[str] = get("username")
+        self.full_name: Optional[str] = get("full_name")
+        self.subscriptions: Dict[str, Any] = get("subscriptions", {})
+        self.exp: Optional[int] = get("exp")
+        self.iat: Optional[int] = get("iat")
+        self.scopes: List[str] = get("scopes", [])
+        self.is_active: bool = get("is_active", True)
         self.raw_payload: Dict[str, Any] = payload
         
     @property
@@ -39,7 +87,7 @@ class JWTPayload:
     def is_expired(self) -> bool:
         """Check if token is expired"""
         if self.exp:
-            return datetime.utcnow().timestamp() > self.exp
+            return time.time() > self.exp
         return False
     
     @property
@@ -66,16 +114,20 @@ def verify_jwt_token(token: str) -> Optional[JWTPayload]:
     Returns:
         JWTPayload object if valid, None otherwise
     """
+    cached = _verified_tokens.get(token)
+    if cached is not None:
+        return cached
+    
     try:
         # First try RS256 with public key (for production tokens)
         try:
             payload = jwt.decode(
                 token,
-                settings.security.jwt_public_key,
+                settings.security.jwt_verification_key,
                 algorithms=["RS256"],
                 options={"verify_exp": True}
             )
-        except (JWTError, Exception):
+        except (InvalidTokenError, Exception):
             # If RS256 fails, try HS256 for development tokens
             payload = jwt.decode(
                 token,
@@ -87,31 +139,45 @@ def verify_jwt_token(token: str) -> Optional[JWTPayload]:
         # Create and return JWTPayload object
         jwt_payload = JWTPayload(payload)
         
-        logger.info(
+        logger.debug(
             "JWT token verified successfully",
             user_id=jwt_payload.user_id,
             has_subscriptions=jwt_payload.has_subscription
         )
         
+        _verified_tokens.set(token, jwt_payload, jwt_payload.exp)
         return jwt_payload
         
     except ExpiredSignatureError:
         logger.warning("JWT token expired")
         return None
         
-    except JWTClaimsError as e:
-        logger.warning(f"JWT claims error: {str(e)}")
+    except _CLAIMS_ERRORS as e:
+        logger.warning("JWT claims error: %s", e)
         return None
         
-    except JWTError as e:
-        logger.warning(f"JWT error: {str(e)}")
+    except InvalidTokenError as e:
+        logger.warning("JWT error: %s", e)
         return None
         
     except Exception as e:
-        logger.error(f"Unexpected error verifying JWT: {str(e)}")
+        logger.error("Unexpected error verifying JWT: %s", e)
         return None
 
 
+async def verify_jwt_token_async(token: str) -> Optional[JWTPayload]:
+    """
+    verify_jwt_token for async callers
+    
+    Cached tokens are returned directly; otherwise signature verification
+    (CPU-bound RSA) runs in the threadpool so it doesn't block the event loop.
+    """
+    cached = _verified_tokens.get(token)
+    if cached is not None:
+        return cached
+    return await run_in_threadpool(verify_jwt_token, token)
+
+
 def create_access_token(
     subject: str,
     expires_delta: Optional[timedelta] = None,
@@ -156,12 +222,18 @@ def create_access_token(
     return encoded_jwt
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def verify_password(plain_password: str, hashed_password: Optional[str]) -> bool:
     """
     Verify a plain password against a hashed password
     (For local user management if needed)
+    
+    Pass None for an unknown user: the password is still checked against
+    a dummy hash so the response time doesn't reveal whether the user exists.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    if hashed_password is None:
+        _pwd_context().verify(plain_password, _DUMMY_PASSWORD_HASH)
+        return False
+    return _pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -169,7 +241,7 @@ def get_password_hash(password: str) -> str:
     Hash a password for storing
     (For local user management if needed)
     """
-    return pwd_context.hash(password)
+    return _pwd_context().hash(password)
 
 
 def extract_token_from_header(authorization: str) -> Optional[str]:
@@ -236,7 +308,6 @@ def validate_subscription(
 # Security utility functions for rate limiting and request validation
 def generate_api_key() -> str:
     """Generate a secure API key"""
-    import secrets
     return secrets.token_urlsafe(32)
 
 
@@ -250,11 +321,5 @@ def validate_api_key(api_key: str) -> bool:
     Returns:
         True if valid format, False otherwise
     """
-    # Basic validation - ensure it's the right length and format
-    if not api_key or len(api_key) < 32:
-        return False
-    
-    # Check if it only contains valid URL-safe characters
-    import string
-    valid_chars = string.ascii_letters + string.digits + "-_"
-    return all(c in valid_chars for c in api_key)
\ No newline at end of file
+    # At least 32 URL-safe characters, checked in a single regex pass
+    return bool(api_key and _API_KEY_RE.fullmatch(api_key))
\ No newline at end of file
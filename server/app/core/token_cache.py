@@ -0,0 +1,60 @@
+"""
+In-process cache of verified JWT payloads
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache mapping a token digest to its verified payload.
+
+    Entries expire after ``ttl`` seconds or at the token's own ``exp``,
+    whichever comes first, so a cached payload is never returned for a
+    token that verification would reject as expired. Only a digest of the
+    token is stored, never the token itself.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[Any]:
+        """Get the cached payload for a token, or None if absent or expired"""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, token: str, payload: Any, exp: Optional[float] = None):
+        """Cache a verified payload until the TTL or the token's exp claim"""
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, exp)
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached payloads"""
+        with self._lock:
+            self._entries.clear()
@@ -1,27 +1,57 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
+from typing import Any, Dict, Final, Optional, Tuple
+import asyncio
 import time
 
+import anyio.to_thread
+import orjson
+
 from app.core.config import settings
-from app.core.logging import get_logger, set_request_id, clear_context, generate_request_id
+from app.core.logging import get_logger
 from app.core.monitoring import ErrorMonitoring
 from app.core.cache import cache_manager
+from app.core.database import DatabaseManager
 from app.core.responses import (
+    APIJSONResponse,
     create_error_response,
     validation_error,
     internal_error,
     ErrorCode
 )
 from app.api.v1 import api_router
-from app.api.middleware import LoggingMiddleware, RateLimitMiddleware
+from app.api.middleware import (
+    FastTrustedHostMiddleware,
+    LoggingMiddleware,
+    RateLimitMiddleware,
+    RequestContextMiddleware
+)
 
 
 logger = get_logger(__name__)
 
+# /health result cache: (monotonic time, encoded payload)
+_HEALTH_TTL = 1.0
+_health_cache: Optional[Tuple[float, bytes]] = None
+
+# /health fields that only depend on settings
+_HEALTH_STATIC: Final[Dict[str, Any]] = {
+    "version": settings.api.version,
+    "environment": settings.environment
+}
+_HEALTH_FEATURES: Final[Dict[str, bool]] = {
+    "database": settings.enable_database,
+    "caching": settings.enable_caching,
+    **settings.features
+}
+_health_lock = asyncio.Lock()
+
+# Worker threads available to sync code paths (JWT verification, Sentry, etc.)
+_THREADPOOL_SIZE = 100
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -29,11 +59,16 @@ async def lifespan(app: FastAPI):
     Application lifespan events
     """
     # Startup
+    app.state.start_time = time.time()
     logger.info("Starting application", environment=settings.environment)
     
     # Initialize Sentry
     ErrorMonitoring.init_sentry(settings)
     
+    # Raise the threadpool limit (default 40) used for sync dependencies,
+    # sync endpoints and run_in_threadpool, so they don't queue under load
+    anyio.to_thread.current_default_thread_limiter().total_tokens = _THREADPOOL_SIZE
+    
     # Connect to cache if enabled
     if settings.enable_caching:
         logger.info("Redis cache enabled")
@@ -42,7 +77,6 @@ async def lifespan(app: FastAPI):
     
     # Initialize database if enabled
     if settings.enable_database:
-        from app.core.database import DatabaseManager
         if await DatabaseManager.check_connection():
             logger.info("Database connection established")
         else:
@@ -59,17 +93,20 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application")
     
-    # Disconnect from cache if enabled
+    # Close cache and database connections concurrently
+    closers = {}
     if settings.enable_caching:
-        await cache_manager.disconnect()
-    
-    # Close database connections if enabled
+        closers["cache"] = cache_manager.disconnect()
     if settings.enable_database:
-        from app.core.database import DatabaseManager
-        await DatabaseManager.close()
+        closers["database"] = DatabaseManager.close()
     
     # Close other connections here
     
+    results = await asyncio.gather(*closers.values(), return_exceptions=True)
+    for component, result in zip(closers, results):
+        if isinstance(result, Exception):
+            logger.error("Error closing %s connections", component, error=result)
+    
     logger.info("Application shutdown complete")
 
 
@@ -81,6 +118,7 @@ app = FastAPI(
     openapi_url=f"{settings.api.prefix}/openapi.json" if not settings.is_production else None,
     docs_url=f"{settings.api.prefix}/docs" if not settings.is_production else None,
     redoc_url=f"{settings.api.prefix}/redoc" if not settings.is_production else None,
+    default_response_class=APIJSONResponse,
     lifespan=lifespan
 )
 
@@ -96,7 +134,7 @@ if settings.is_production:
             allowed_hosts.append(parsed.hostname)
     
     app.add_middleware(
-        TrustedHostMiddleware,
+        FastTrustedHostMiddleware,
         allowed_hosts=allowed_hosts
     )
 
@@ -113,6 +151,21 @@ app.add_middleware(
 app.add_middleware(LoggingMiddleware)
 if settings.api.rate_limit_enabled:
     app.add_middleware(RateLimitMiddleware)
+# Outermost: request ID context plus X-Request-ID / X-Process-Time headers
+app.add_middleware(RequestContextMiddleware)
+
+
+# Map HTTP status codes to error codes
+_ERROR_CODE_MAP: Final[Dict[int, ErrorCode]] = {
+    400: ErrorCode.INVALID_REQUEST,
+    401: ErrorCode.AUTHENTICATION_REQUIRED,
+    403: ErrorCode.PERMISSION_DENIED,
+    404: ErrorCode.NOT_FOUND,
+    429: ErrorCode.RATE_LIMIT_EXCEEDED,
+    500: ErrorCode.INTERNAL_ERROR,
+    502: ErrorCode.EXTERNAL_API_ERROR,
+    503: ErrorCode.SERVICE_UNAVAILABLE
+}
 
 
 # Global exception handlers
@@ -121,15 +174,15 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     """
     Handle validation errors with proper formatting
     """
-    errors = []
-    for error in exc.errors():
-        error_detail = {
-            "field": ".".join(str(loc) for loc in error["loc"]),
+    errors = [
+        {
+            "field": ".".join(map(str, error["loc"])),
             "message": error["msg"],
             "type": error["type"]
         }
-        errors.append(error_detail)
-        
+        for error in exc.errors()
+    ]
+    
     return validation_error(
         message="Request validation failed",
         errors=errors
@@ -141,19 +194,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """
     Handle HTTP exceptions
     """
-    # Map status codes to error codes
-    error_code_map = {
-        400: ErrorCode.INVALID_REQUEST,
-        401: ErrorCode.AUTHENTICATION_REQUIRED,
-        403: ErrorCode.PERMISSION_DENIED,
-        404: ErrorCode.NOT_FOUND,
-        429: ErrorCode.RATE_LIMIT_EXCEEDED,
-        500: ErrorCode.INTERNAL_ERROR,
-        502: ErrorCode.EXTERNAL_API_ERROR,
-        503: ErrorCode.SERVICE_UNAVAILABLE
-    }
-    
-    error_code = error_code_map.get(exc.status_code, ErrorCode.INTERNAL_ERROR)
+    error_code = _ERROR_CODE_MAP.get(exc.status_code, ErrorCode.INTERNAL_ERROR)
     
     return create_error_response(
         error_code=error_code,
@@ -171,12 +212,13 @@ async def global_exception_handler(request: Request, exc: Exception):
     logger.error("Unhandled exception", error=exc)
     
     # Capture to Sentry
+    client = request.client
     ErrorMonitoring.capture_exception(
         exc,
         context={
             "path": request.url.path,
             "method": request.method,
-            "client": request.client.host if request.client else None
+            "client": client.host if client else None
         }
     )
     
@@ -187,62 +229,30 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-# Request ID middleware
-@app.middleware("http")
-async def add_request_id(request: Request, call_next):
-    """
-    Add request ID to context and response headers
-    """
-    request_id = generate_request_id()
-    set_request_id(request_id)
-    
-    # Store in request state for access in endpoints
-    request.state.request_id = request_id
-    
-    try:
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
-    finally:
-        clear_context()
-
-
-# Process time middleware
-@app.middleware("http")
-async def add_process_time(request: Request, call_next):
-    """
-    Add process time to response headers
-    """
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(round(process_time * 1000, 2))
-    return response
-
-
 # Include API router
 app.include_router(api_router, prefix=settings.api.prefix)
 
 
-# Root endpoint
+# Root endpoint body only depends on settings, so encode it once
+_ROOT_BODY: Final[bytes] = orjson.dumps({
+    "name": settings.api.title,
+    "version": settings.api.version,
+    "environment": settings.environment,
+    "docs": f"{settings.api.prefix}/docs" if not settings.is_production else None
+})
+
+
 @app.get("/", tags=["root"])
 async def root():
     """
     Root endpoint
     """
-    return {
-        "name": settings.api.title,
-        "version": settings.api.version,
-        "environment": settings.environment,
-        "docs": f"{settings.api.prefix}/docs" if not settings.is_production else None
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
-# Health check endpoint
-@app.get("/health", tags=["health"])
-async def health_check():
+async def _collect_health() -> Dict[str, Any]:
     """
-    Health check endpoint with detailed status
+    Run the health checks and build the /health payload
     """
     # Check cache connection
     cache_status = {
@@ -258,7 +268,6 @@ async def health_check():
     }
     
     if settings.enable_database:
-        from app.core.database import DatabaseManager
         database_status["connected"] = await DatabaseManager.check_connection()
     
     # Check external services (example)
@@ -274,26 +283,42 @@ async def health_check():
     
     health_data = {
         "status": "healthy" if is_healthy else "degraded",
-        "version": settings.api.version,
-        "environment": settings.environment,
-        "uptime_seconds": time.time() - app.state.start_time if hasattr(app.state, "start_time") else 0,
+        **_HEALTH_STATIC,
+        "uptime_seconds": time.time() - app.state.start_time,
         "cache": cache_status,
         "database": database_status,
         "external_services": external_services,
-        "features": {
-            "database": settings.enable_database,
-            "caching": settings.enable_caching,
-            **settings.features
-        }
+        "features": _HEALTH_FEATURES
     }
     
     return health_data
 
 
-# Set start time on startup
-@app.on_event("startup")
-async def set_start_time():
-    app.state.start_time = time.time()
+# Health check endpoint
+@app.get("/health", tags=["health"])
+async def health_check():
+    """
+    Health check endpoint with detailed status
+    
+    Results are reused for up to _HEALTH_TTL seconds, so bursts of probes
+    share one database/cache check; concurrent misses wait on a single refresh.
+    The payload is cached already encoded, so hits skip serialization.
+    """
+    global _health_cache
+    
+    cached = _health_cache
+    if cached and time.monotonic() - cached[0] < _HEALTH_TTL:
+        return Response(content=cached[1], media_type="application/json")
+    
+    async with _health_lock:
+        cached = _health_cache
+        if cached and time.monotonic() - cached[0] < _HEALTH_TTL:
+            return Response(content=cached[1], media_type="application/json")
+        
+        body = orjson.dumps(await _collect_health())
+        _health_cache = (time.monotonic(), body)
+        
+    return Response(content=body, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -304,5 +329,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.is_development,
-        log_level=settings.logging_config.level.lower()
+        log_level=settings.logging_config.level.lower(),
+        # C event loop and HTTP parser, both installed by uvicorn[standard]
+        loop="uvloop",
+        http="httptools"
     )
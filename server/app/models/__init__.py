@@ -1,24 +1,35 @@
 """
 Database models for the Trading Tools application
 """
+from sqlalchemy.orm import configure_mappers
+
+from app.core.database import Base, metadata
 from app.models.user import User
 from app.models.api_key import APIKey
 from app.models.watchlist import Watchlist
-from app.models.stocks import Stock, HistoricalData, EMACache
+from app.models.stocks import Stock, HistoricalData, EMACache, TrackedTicker
 from app.models.movers import TodaysMover, MainList
 from app.models.trades import CreditSpread
 from app.models.archive import Last7DaysMovers, TransferStatus
+from app.models.claims import Claims
 
 __all__ = [
+    "Base",
+    "metadata",
     "User", 
     "APIKey", 
     "Watchlist",
     "Stock",
     "HistoricalData",
     "EMACache",
+    "TrackedTicker",
     "TodaysMover",
     "MainList",
     "CreditSpread",
     "Last7DaysMovers",
-    "TransferStatus"
-]
\ No newline at end of file
+    "TransferStatus",
+    "Claims"
+]
+
+# Resolve all mappers at import time instead of on the first query
+configure_mappers()
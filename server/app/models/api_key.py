@@ -8,6 +8,7 @@ from uuid import uuid4
 from sqlalchemy import String, DateTime, Text, ForeignKey, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
 
 from app.core.database import Base
 
@@ -21,13 +22,14 @@ class APIKey(Base):
     __table_args__ = (
         UniqueConstraint("user_id", "name", name="uq_api_keys_user_id_name"),
     )
+    # Fetch server-generated timestamps via RETURNING on update as well as insert
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary key
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
-        index=True
+        default=lambda: str(uuid4())
     )
     
     # Foreign key to user
@@ -72,13 +74,13 @@ class APIKey(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()
     )
     last_used_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
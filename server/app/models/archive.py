@@ -5,26 +5,28 @@ from datetime import datetime, date
 from typing import Optional
 from decimal import Decimal
 
-from sqlalchemy import String, Boolean, DateTime, Date, Numeric, Integer
+from sqlalchemy import String, Boolean, DateTime, Date, Numeric, BigInteger, Integer, Identity
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.models.movers import MoverType, mover_type_enum
 
 
 class Last7DaysMovers(Base):
     """7-day rolling archive of market movers"""
     __tablename__ = "last_7_days_movers"
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1, cache=1000), primary_key=True)
     symbol: Mapped[str] = mapped_column(String(20), nullable=False, unique=True, index=True)
     last_seen_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
         comment="Last time this symbol appeared in movers"
     )
-    mover_type: Mapped[str] = mapped_column(
-        String(20),
+    mover_type: Mapped[MoverType] = mapped_column(
+        mover_type_enum,
         nullable=False,
         comment="uptrend or downtrend"
     )
@@ -41,7 +43,7 @@ class TransferStatus(Base):
     """Track daily transfer operations"""
     __tablename__ = "transfer_status"
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     transfer_date: Mapped[date] = mapped_column(
         Date,
         nullable=False,
@@ -10,7 +10,7 @@ class Claims(Base):
     """
     __tablename__ = "claims"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     ticker = Column(String(10), nullable=False, index=True)
     
     # Entry details
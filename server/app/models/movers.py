@@ -1,25 +1,50 @@
 """
 Market movers and lists models
 """
+import enum
 from datetime import datetime, date
 from typing import Optional
 from decimal import Decimal
 
-from sqlalchemy import String, Boolean, DateTime, Date, Numeric, BigInteger, Integer
+from sqlalchemy import String, Boolean, DateTime, Date, Numeric, Double, BigInteger, Integer, Identity, Index, text
+from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
 
 from app.core.database import Base
 
 
+class MoverType(str, enum.Enum):
+    """Trend direction of a mover or main list entry"""
+    UPTREND = "uptrend"
+    DOWNTREND = "downtrend"
+    
+    def __str__(self) -> str:
+        return self.value
+
+
+# Native Postgres enum shared by every mover_type/list_type column;
+# stores the lowercase values so existing string comparisons still match
+mover_type_enum = SQLEnum(
+    MoverType,
+    name="mover_type_enum",
+    values_callable=lambda members: [member.value for member in members]
+)
+
+
 class TodaysMover(Base):
     """Today's market movers model"""
     __tablename__ = "todays_movers"
+    __table_args__ = (
+        Index('ix_todays_movers_symbol_mover_type', 'symbol', 'mover_type', unique=True),
+        Index('idx_todays_movers_type_calc', 'mover_type', 'calculated_at'),
+    )
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1, cache=1000), primary_key=True)
     symbol: Mapped[str] = mapped_column(String(20), nullable=False)
     name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    mover_type: Mapped[str] = mapped_column(
-        String(20), 
+    mover_type: Mapped[MoverType] = mapped_column(
+        mover_type_enum,
         nullable=False,
         index=True,
         comment="uptrend or downtrend"
@@ -29,19 +54,19 @@ class TodaysMover(Base):
     price_change_percent: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
     volume: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     avg_volume: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
-    volume_ratio: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    volume_ratio: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     
     # EMA values
-    ema22: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 4), nullable=True)
-    ema53: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 4), nullable=True)
-    ema208: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 4), nullable=True)
-    ema_strength: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(10, 2), 
+    ema22: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    ema53: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    ema208: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    ema_strength: Mapped[Optional[float]] = mapped_column(
+        Double, 
         nullable=True,
         comment="Position relative to EMAs"
     )
-    trend_score: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(10, 2),
+    trend_score: Mapped[Optional[float]] = mapped_column(
+        Double,
         nullable=True,
         comment="Calculated trend strength"
     )
@@ -63,12 +88,12 @@ class TodaysMover(Base):
     last_updated: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     calculated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        server_default=func.now(),
         index=True
     )
     
@@ -79,27 +104,35 @@ class TodaysMover(Base):
 class MainList(Base):
     """Main curated lists model"""
     __tablename__ = "main_lists"
+    __table_args__ = (
+        Index('ix_main_lists_symbol_list_type', 'symbol', 'list_type', unique=True),
+        Index(
+            'idx_main_lists_active_type',
+            'list_type',
+            postgresql_where=text('is_active = true')
+        ),
+    )
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     symbol: Mapped[str] = mapped_column(String(20), nullable=False)
     name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    list_type: Mapped[str] = mapped_column(
-        String(20),
+    list_type: Mapped[MoverType] = mapped_column(
+        mover_type_enum,
         nullable=False,
         index=True,
         comment="uptrend or downtrend"
     )
     last_price: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
-    variability_52w: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
-    variability_monthly: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
-    variability_3day: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    variability_52w: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    variability_monthly: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    variability_3day: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     passed_variability_check: Mapped[bool] = mapped_column(Boolean, default=False)
     special_character: Mapped[Optional[str]] = mapped_column(String(5), nullable=True)
     added_date: Mapped[date] = mapped_column(Date, nullable=False, default=date.today)
     last_updated: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
     
@@ -6,8 +6,9 @@ from datetime import date as date_type
 from typing import Optional
 from decimal import Decimal
 
-from sqlalchemy import String, Boolean, DateTime, Date, Text, Numeric, BigInteger, Integer
+from sqlalchemy import String, Boolean, DateTime, Date, Text, Numeric, Double, BigInteger, Integer, Identity, Index
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
 
 from app.core.database import Base
 
@@ -16,7 +17,7 @@ class Stock(Base):
     """Stock information model"""
     __tablename__ = "stocks"
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     symbol: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
     name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -27,16 +28,16 @@ class Stock(Base):
         default="neutral",
         index=True
     )
-    variability_52w: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
-    variability_monthly: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
-    variability_3day: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    variability_52w: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    variability_monthly: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    variability_3day: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     passed_variability_check: Mapped[bool] = mapped_column(Boolean, default=False)
     special_character: Mapped[Optional[str]] = mapped_column(String(5), nullable=True)
     last_verified: Mapped[Optional[date_type]] = mapped_column(Date, nullable=True)
     last_updated: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     
     def __repr__(self) -> str:
@@ -46,8 +47,11 @@ class Stock(Base):
 class HistoricalData(Base):
     """Historical price data model"""
     __tablename__ = "historical_data"
+    __table_args__ = (
+        Index('ix_historical_data_symbol_date', 'symbol', 'date', unique=True),
+    )
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1, cache=1000), primary_key=True)
     symbol: Mapped[str] = mapped_column(String(20), nullable=False)
     date: Mapped[date_type] = mapped_column(Date, nullable=False)
     open: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
@@ -58,7 +62,7 @@ class HistoricalData(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     
     def __repr__(self) -> str:
@@ -68,43 +72,46 @@ class HistoricalData(Base):
 class EMACache(Base):
     """Cached EMA calculations model"""
     __tablename__ = "ema_cache"
+    __table_args__ = (
+        Index('ix_ema_cache_symbol_date', 'symbol', 'date', unique=True),
+    )
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1, cache=1000), primary_key=True)
     symbol: Mapped[str] = mapped_column(String(20), nullable=False)
     date: Mapped[date_type] = mapped_column(Date, nullable=False)
-    ema22: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 4), nullable=True)
-    ema53: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 4), nullable=True)
-    ema208: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 4), nullable=True)
+    ema22: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    ema53: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    ema208: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     
     def __repr__(self) -> str:
         return f"<EMACache(symbol={self.symbol}, date={self.date})>"
 
 
-class MainList(Base):
+class TrackedTicker(Base):
     """Main list of stocks to track - matches income-machine-v2 structure"""
     __tablename__ = "main_list"
     
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     ticker: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
     last_price: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
     trend: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
-    rsi: Mapped[Optional[Decimal]] = mapped_column(Numeric(5, 2), nullable=True)
-    ema20: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
-    ema50: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    rsi: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    ema20: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    ema50: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     volume: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
-    iv_rank: Mapped[Optional[Decimal]] = mapped_column(Numeric(5, 2), nullable=True)
+    iv_rank: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     spread_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    best_roi: Mapped[Optional[Decimal]] = mapped_column(Numeric(5, 2), nullable=True)
+    best_roi: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     last_updated: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     
     def __repr__(self) -> str:
-        return f"<MainList(ticker={self.ticker}, trend={self.trend})>"
\ No newline at end of file
+        return f"<TrackedTicker(ticker={self.ticker}, trend={self.trend})>"
\ No newline at end of file
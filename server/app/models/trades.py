@@ -2,19 +2,24 @@
 Credit spread trades model
 """
 from datetime import datetime, date
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
 from decimal import Decimal
 from uuid import uuid4
 
-from sqlalchemy import String, Boolean, DateTime, Date, Numeric, Integer, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+import orjson
+from sqlalchemy import String, Boolean, DateTime, Date, Numeric, Integer, ForeignKey, insert
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.core.database import Base, mark_writes
 
 if TYPE_CHECKING:
     from app.models.user import User
 
+# Batches at least this large are written with COPY instead of INSERT
+BULK_COPY_THRESHOLD = 100
+
 
 class CreditSpread(Base):
     """Credit spread trades model"""
@@ -24,8 +29,7 @@ class CreditSpread(Base):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
-        index=True
+        default=lambda: str(uuid4())
     )
     
     # User relationship
@@ -54,9 +58,9 @@ class CreditSpread(Base):
     breakeven: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     buffer_room: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     
-    # Price scenarios (JSON)
+    # Price scenarios (JSONB)
     scenarios: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Price scenarios JSON"
     )
@@ -128,4 +132,56 @@ class CreditSpread(Base):
             "profitLoss": float(self.profit_loss) if self.profit_loss else None,
             "createdAt": self.created_at.isoformat(),
             "updatedAt": self.updated_at.isoformat()
-        }
\ No newline at end of file
+        }
+    
+    @classmethod
+    async def bulk_copy(cls, session: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many credit spreads in one round trip
+        
+        Large batches are streamed with PostgreSQL COPY through the
+        session's asyncpg connection; smaller ones use a multi-row INSERT.
+        COPY skips ORM defaults, so they are applied to each row here.
+        
+        Args:
+            session: Database session (its transaction is used, not committed)
+            rows: Column name -> value mappings
+            
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+            
+        if len(rows) < BULK_COPY_THRESHOLD:
+            await session.execute(insert(cls), rows)
+            return len(rows)
+            
+        columns = list(cls.__table__.columns)
+        records = []
+        for row in rows:
+            record = []
+            for column in columns:
+                if column.key in row:
+                    value = row[column.key]
+                elif column.default is None:
+                    value = None
+                elif column.default.is_callable:
+                    value = column.default.arg(None)
+                else:
+                    value = column.default.arg
+                # asyncpg's default JSONB codec expects text
+                if column.key == "scenarios" and value is not None:
+                    value = orjson.dumps(value).decode()
+                record.append(value)
+            records.append(tuple(record))
+            
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            cls.__tablename__,
+            records=records,
+            columns=[column.name for column in columns]
+        )
+        mark_writes(session)
+        return len(records)
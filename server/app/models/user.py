@@ -25,8 +25,7 @@ class User(Base):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
-        index=True
+        default=lambda: str(uuid4())
     )
     
     # External authentication
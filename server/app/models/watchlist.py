@@ -5,8 +5,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from uuid import uuid4
 
-from sqlalchemy import String, DateTime, JSON, ForeignKey, UniqueConstraint, Integer, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, DateTime, ForeignKey, UniqueConstraint, Index, Integer, Boolean, Select, select
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -20,14 +20,20 @@ class Watchlist(Base):
     __tablename__ = "watchlists"
     __table_args__ = (
         UniqueConstraint("user_id", "name", name="uq_watchlists_user_id_name"),
+        # Answers symbols @> '[{"symbol": ...}]' containment queries
+        Index(
+            "idx_watchlists_symbols_gin",
+            "symbols",
+            postgresql_using="gin",
+            postgresql_ops={"symbols": "jsonb_path_ops"}
+        ),
     )
     
     # Primary key
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
-        index=True
+        default=lambda: str(uuid4())
     )
     
     # Foreign key to user
@@ -50,9 +56,9 @@ class Watchlist(Base):
         comment="Optional description"
     )
     
-    # Symbols stored as JSON array
+    # Symbols stored as JSONB array
     symbols: Mapped[List[Dict[str, Any]]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=False,
         default=list,
         comment="Array of symbol objects with metadata"
@@ -101,7 +107,8 @@ class Watchlist(Base):
         symbol_obj.update(metadata)
         
         if not any(s["symbol"] == symbol.upper() for s in self.symbols):
-            self.symbols.append(symbol_obj)
+            # Reassign rather than append so the change is flushed
+            self.symbols = [*self.symbols, symbol_obj]
             self.symbol_count = len(self.symbols)
     
     def remove_symbol(self, symbol: str):
@@ -111,4 +118,9 @@ class Watchlist(Base):
     
     def has_symbol(self, symbol: str) -> bool:
         """Check if watchlist contains a symbol"""
-        return any(s["symbol"] == symbol.upper() for s in self.symbols)
\ No newline at end of file
+        return any(s["symbol"] == symbol.upper() for s in self.symbols)
+    
+    @classmethod
+    def containing_symbol(cls, symbol: str) -> Select:
+        """Select watchlists containing a symbol, served by the GIN index"""
+        return select(cls).where(cls.symbols.contains([{"symbol": symbol.upper()}]))
@@ -0,0 +1,72 @@
+"""
+Test cases for Redis cache payload encoding
+"""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.core.cache import (
+    CachedCreditSpread,
+    _COMPRESS_THRESHOLD,
+    _deserialize,
+    _serialize,
+)
+
+
+def _spread_payload():
+    return {
+        "success": True,
+        "ticker": "AAPL",
+        "current_stock_price": 190.5,
+        "trend": "uptrend",
+        "spread_analysis": {"found": True, "roi_percent": 9.2},
+        "market_context": {"cache_hit": False},
+        "timestamp": "2024-01-02T15:30:00",
+        "message": None,
+    }
+
+
+def test_json_round_trip():
+    """Test plain JSON values survive a round trip"""
+    value = {"symbol": "SPY", "prices": [1.5, 2.5], "count": 2}
+    data = _serialize(value)
+
+    assert data[:1] == b"J"
+    assert _deserialize(data) == value
+
+
+def test_json_special_types():
+    """Test datetimes, decimals and sets are encoded as plain data"""
+    data = _serialize({"at": datetime(2024, 1, 2, 3, 4, 5), "price": Decimal("1.25"), "tags": {"a"}})
+
+    assert _deserialize(data) == {"at": "2024-01-02T03:04:05Z", "price": 1.25, "tags": ["a"]}
+
+
+def test_unsupported_type_rejected():
+    """Test arbitrary objects are rejected at write time"""
+    with pytest.raises(TypeError):
+        _serialize({"value": object()})
+
+
+def test_credit_spread_round_trip():
+    """Test credit spread structs decode back to the response dict shape"""
+    payload = _spread_payload()
+    data = _serialize(CachedCreditSpread(**payload))
+
+    assert data[:1] == b"S"
+    assert _deserialize(data) == payload
+
+
+def test_large_payload_compressed():
+    """Test payloads above the threshold are compressed and restored"""
+    value = {"strikes": list(range(_COMPRESS_THRESHOLD))}
+    data = _serialize(value)
+
+    assert data[:1] == b"Z"
+    assert _deserialize(data) == value
+
+
+def test_legacy_unmarked_json():
+    """Test entries written before codec markers are still readable"""
+    assert _deserialize(b'{"symbol": "QQQ"}') == {"symbol": "QQQ"}
@@ -0,0 +1,77 @@
+"""
+Test cases for the batched log file handler
+"""
+import logging
+import os
+
+from app.core.logging import _BatchedRotatingFileHandler
+
+
+def _record(level: int, message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+def test_writes_deferred_until_error(tmp_path):
+    """Test records stay buffered with rotation enabled until an ERROR arrives"""
+    path = tmp_path / "app.log"
+    handler = _BatchedRotatingFileHandler(
+        str(path), maxBytes=10_485_760, backupCount=1, flush_interval=60
+    )
+    try:
+        for i in range(4):
+            handler.emit(_record(logging.INFO, f"info {i}"))
+        assert os.path.getsize(path) == 0
+
+        handler.emit(_record(logging.ERROR, "boom"))
+        assert path.read_text().splitlines() == ["info 0", "info 1", "info 2", "info 3", "boom"]
+    finally:
+        handler.close()
+
+
+def test_writes_flushed_on_interval(tmp_path):
+    """Test the background flusher writes buffered records out"""
+    path = tmp_path / "app.log"
+    handler = _BatchedRotatingFileHandler(
+        str(path), maxBytes=10_485_760, backupCount=1, flush_interval=0.01
+    )
+    try:
+        handler.emit(_record(logging.INFO, "info"))
+        handler._stop_flusher.wait(0.2)
+        assert path.read_text() == "info\n"
+    finally:
+        handler.close()
+
+
+def test_rollover_from_tracked_size(tmp_path):
+    """Test the file rotates once the tracked size would exceed maxBytes"""
+    path = tmp_path / "app.log"
+    handler = _BatchedRotatingFileHandler(
+        str(path), maxBytes=20, backupCount=1, flush_interval=60
+    )
+    try:
+        handler.emit(_record(logging.INFO, "0123456789"))
+        handler.emit(_record(logging.INFO, "abcdefghij"))
+        handler.flush()
+
+        assert (tmp_path / "app.log.1").read_text() == "0123456789\n"
+        assert path.read_text() == "abcdefghij\n"
+    finally:
+        handler.close()
+
+
+def test_buffer_holds_a_full_batch(tmp_path):
+    """Test a batch larger than the default io buffer goes out in one flush"""
+    path = tmp_path / "app.log"
+    handler = _BatchedRotatingFileHandler(
+        str(path), maxBytes=10_485_760, backupCount=1, flush_interval=60
+    )
+    try:
+        line = "x" * 199
+        for _ in range(200):  # 40 KB, well past the 8 KB default buffer
+            handler.emit(_record(logging.INFO, line))
+        assert os.path.getsize(path) == 0
+
+        handler.flush()
+        assert os.path.getsize(path) == 200 * 200
+    finally:
+        handler.close()
@@ -0,0 +1,42 @@
+"""
+Test cases for the token bucket rate limiter
+"""
+from app.api.middleware import RateLimitMiddleware
+
+
+def _limiter(capacity: float, refill_rate: float) -> RateLimitMiddleware:
+    limiter = RateLimitMiddleware(app=None)
+    limiter.capacity = capacity
+    limiter.refill_rate = refill_rate
+    return limiter
+
+
+def test_bucket_exhausts_and_refills():
+    """Test requests beyond capacity are refused until tokens refill"""
+    limiter = _limiter(capacity=2, refill_rate=1.0)
+
+    assert limiter._take_token("1.2.3.4", now=0.0) == 1
+    assert limiter._take_token("1.2.3.4", now=0.0) == 0
+    assert limiter._take_token("1.2.3.4", now=0.5) is None
+    assert limiter._get_retry_after("1.2.3.4") == 1
+    assert limiter._take_token("1.2.3.4", now=1.0) == 0
+
+
+def test_clients_have_separate_buckets():
+    """Test one client exhausting its bucket doesn't affect another"""
+    limiter = _limiter(capacity=1, refill_rate=0.1)
+
+    assert limiter._take_token("1.1.1.1", now=0.0) == 0
+    assert limiter._take_token("1.1.1.1", now=0.0) is None
+    assert limiter._take_token("2.2.2.2", now=0.0) == 0
+
+
+def test_cleanup_drops_refilled_buckets():
+    """Test idle buckets are evicted once they would be full again"""
+    limiter = _limiter(capacity=10, refill_rate=1.0)
+    limiter._take_token("1.1.1.1", now=0.0)
+    limiter._take_token("2.2.2.2", now=5.0)
+
+    limiter._cleanup_old_entries(now=10.0)
+
+    assert list(limiter.buckets) == ["2.2.2.2"]
@@ -0,0 +1,24 @@
+"""
+Test cases for API response encoding
+"""
+from decimal import Decimal
+
+import orjson
+from pydantic import BaseModel
+
+from app.core.responses import create_success_response
+
+
+class _Quote(BaseModel):
+    symbol: str
+    price: float
+
+
+def test_success_response_encodes_decimals_and_models():
+    """Test Decimal values and pydantic models in data are serialized"""
+    response = create_success_response(
+        data={"quote": _Quote(symbol="SPY", price=510.25), "strike": Decimal("505.50")}
+    )
+    body = orjson.loads(response.body)
+
+    assert body["data"] == {"quote": {"symbol": "SPY", "price": 510.25}, "strike": 505.5}
@@ -0,0 +1,37 @@
+"""
+Test cases for the verified JWT payload cache
+"""
+import time
+
+from app.core.token_cache import VerifiedTokenCache
+
+
+def test_hit_and_miss():
+    """Test cached payloads are returned only for the same token"""
+    cache = VerifiedTokenCache()
+    payload = {"sub": "user-1"}
+    cache.set("token-a", payload)
+
+    assert cache.get("token-a") is payload
+    assert cache.get("token-b") is None
+
+
+def test_expires_at_token_exp():
+    """Test entries never outlive the token's exp claim"""
+    cache = VerifiedTokenCache(ttl=300)
+    cache.set("expired", {"sub": "user-1"}, exp=time.time() - 1)
+
+    assert cache.get("expired") is None
+
+
+def test_evicts_least_recently_used():
+    """Test the cache stays within maxsize"""
+    cache = VerifiedTokenCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3